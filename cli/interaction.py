@@ -1,4 +1,6 @@
 import argparse
+import asyncio
+import re
 from pathlib import Path
 from prompt_toolkit import HTML, PromptSession
 from prompt_toolkit.history import FileHistory
@@ -20,18 +22,6 @@ class StorageType(Enum):
     # GCS = "gcs" 
     # AZURE = "azure"
 
-def print_sql_preview(rows: list, limit: int = 10):
-    messenger = get_messenger()
-    if not rows:
-        messenger.warning("No rows returned")
-        return
-    for i, row in enumerate(rows):
-        if i < limit:
-            print(row)
-        elif i == limit:
-            print(f"... {len(rows) - limit} more rows hidden")
-            break
-
 async def select_storage_type() -> StorageType:
     """Selecting a storage location without a dialogue box, directly in the console."""
     
@@ -74,25 +64,50 @@ async def select_storage_type() -> StorageType:
         except KeyboardInterrupt:
             return StorageType.LOCAL
         
+_TRUE_STRINGS = frozenset({'yes', 'true', 't', 'y', '1'})
+_FALSE_STRINGS = frozenset({'no', 'false', 'f', 'n', '0'})
+
 def str_to_bool_caster(v):
     if isinstance(v, bool):
         return v
     lv = v.lower()
-    if lv in ('yes', 'true', 't', 'y', '1'):
+    if lv in _TRUE_STRINGS:
         return True
-    if lv in ('no', 'false', 'f', 'n', '0'):
+    if lv in _FALSE_STRINGS:
         return False
     raise argparse.ArgumentTypeError('Boolean value expected.')
 
-def parse_query_args(query: str):
-    messenger = get_messenger()
+# A token is a run of plain text and quoted sections, so SQL literals like 'a b' and
+# -path "/My Backups" stay whole; an unterminated quote falls back to plain text.
+_TOKEN_RE = re.compile(r"""(?:[^\s'"]+|'[^']*'|"[^"]*")+|\S+""")
+
+def split_query(query: str) -> list:
+    return _TOKEN_RE.findall(query)
+
+def path_arg(value: str) -> Path:
+    """-path value with one pair of surrounding quotes removed."""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        value = value[1:-1]
+    return Path(value)
+
+def _build_query_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(add_help=False, exit_on_error=False)
-    parser.add_argument("-path", type=Path, default=None, help="Destination path")
-    parser.add_argument("-compress", type=str_to_bool_caster, default=False, help="Compression flag")
+    parser.add_argument("-path", type=path_arg, default=None, help="Destination path (quote it if it has spaces)")
+    parser.add_argument("-compress", type=str_to_bool_caster, default=False, help="Compress -extract output with zstd (.csv.zst)")
     parser.add_argument("-extract", action='store_true', help="Extract SQL result to CSV")
+    parser.add_argument("-server-side", action='store_true', help="Export via COPY TO PROGRAM on a local PostgreSQL server")
+    parser.add_argument("-copy-mode", action='store_true', help="Stream the export with COPY TO STDOUT (PostgreSQL)")
     parser.add_argument("-single-archive", type=str_to_bool_caster, default=True, help="Create single .tar.zst archive")
+    parser.add_argument("-verify", action='store_true', help="Verify the backup against backup_manifest (PostgreSQL)")
+    return parser
+
+# Built once; parse_known_args returns a fresh Namespace on every call
+_QUERY_PARSER = _build_query_parser()
+
+def parse_query_args(query: str):
+    messenger = get_messenger()
     try:
-        known_args, command_tokens = parser.parse_known_args(query.split())
+        known_args, command_tokens = _QUERY_PARSER.parse_known_args(split_query(query))
         return known_args, command_tokens
     except (SystemExit, argparse.ArgumentError) as e:
         messenger.warning(f"[PARSING ERROR] {e}")
@@ -102,27 +117,30 @@ def parse_query_args(query: str):
         return None, None
 
 class SQLCompleter(Completer):
-    keywords = [
+    keywords = (
         'SELECT', 'FROM', 'WHERE', 'INSERT', 'UPDATE', 'DELETE',
         'JOIN', 'LEFT JOIN', 'RIGHT JOIN', 'INNER JOIN', 'OUTER JOIN',
         'ORDER BY', 'GROUP BY', 'HAVING', 'LIMIT', 'OFFSET',
         'AS', 'AND', 'OR', 'NOT', 'IN', 'LIKE', 'BETWEEN',
         'COUNT', 'SUM', 'AVG', 'MAX', 'MIN', 'DISTINCT',
-    ]
-    commands = ['help', 'exit', 'quit', 'full database', 'differential backup', 'SQL', '-path', '-extract']
+    )
+    commands = ('help', 'exit', 'quit', 'full database', 'differential backup', 'SQL', '-path', '-extract', '-server-side', '-copy-mode', '-verify')
+    # Case-folded once here; get_completions runs on every keystroke
+    _commands_folded = tuple((cmd.lower(), cmd) for cmd in commands)
 
     def get_completions(self, document, complete_event):
         word_before_cursor = document.get_word_before_cursor()
-        text_before_cursor = document.text_before_cursor
-        if text_before_cursor.upper().startswith('SQL'):
+        start_position = -len(word_before_cursor)
+        if document.text_before_cursor[:3].upper() == 'SQL':
+            prefix = word_before_cursor.upper()
             for keyword in self.keywords:
-                if keyword.startswith(word_before_cursor.upper()):
-                    yield Completion(keyword, start_position=-len(word_before_cursor))
+                if keyword.startswith(prefix):
+                    yield Completion(keyword, start_position=start_position)
         else:
-            for cmd in self.commands:
-                if cmd.startswith(word_before_cursor.lower()):
-                    yield Completion(cmd, start_position=-len(word_before_cursor))
-
+            prefix = word_before_cursor.lower()
+            for folded, cmd in self._commands_folded:
+                if folded.startswith(prefix):
+                    yield Completion(cmd, start_position=start_position)
 
 
 async def interactive_console(
@@ -186,13 +204,14 @@ async def interactive_console(
             if parsed_args is None:
                 continue
 
-            command = " ".join(command_tokens).lower()
+            command = " ".join(command_tokens)
 
-            if command in ['exit', 'quit']:
+            if command.lower() in ['exit', 'quit']:
                 messenger.info("Goodbye! 👋")
                 break
             try:
-                dispatcher.dispatch(command, parsed_args)
+                # Backups and queries block for a long time; keep them off the event loop thread
+                await asyncio.to_thread(dispatcher.dispatch, command, parsed_args)
             except ValueError as e:
                 messenger.error(str(e))
             except Exception as e:
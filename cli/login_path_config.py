@@ -164,13 +164,13 @@ class PostgreSQLPgPassManager:
         entry = f"{host}:{port}:{database}:{user}:{password}\n"
         
         try:
-            if not self._pgpass_file.exists():
-                self._pgpass_file.touch(mode=0o600)
-            else:
-                self._pgpass_file.chmod(0o600)
-            
-            with open(self._pgpass_file, 'a') as f:
-                f.write(entry)
+            # Created as 0600 in the same call; an existing file is tightened through the fd
+            fd = os.open(self._pgpass_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            try:
+                os.fchmod(fd, 0o600)
+                os.write(fd, entry.encode())
+            finally:
+                os.close(fd)
             
             self._messenger.success(f".pgpass entry created successfully!")
             return True
@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 from console_utils import get_messenger
+from utility.json_io import write_json
 
 class PostgresWalArchiveConfig:
     """Manages PostgreSQL WAL archive directory configuration"""
@@ -32,8 +33,7 @@ class PostgresWalArchiveConfig:
     
     def _save_config(self, config: dict) -> bool:
         try:
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            write_json(self.CONFIG_FILE, config)
             return True
         except Exception as e:
             self._messenger.error(f"Failed to save config: {e}")
@@ -1,6 +1,5 @@
 import os
 from pathlib import Path
-from datetime import datetime
 import shutil
 from decorators.utility_available import check_utility_available
 from factory import DatabaseClient
@@ -14,7 +13,6 @@ from pymysql import err
 from pymysql.connections import Connection
 from typing import Optional, List
 import subprocess
-from services.backup.archive_utils import create_single_archive
 
 
 class MysqlClient(ConnectionConfigMixin,
@@ -36,6 +34,7 @@ class MysqlClient(ConnectionConfigMixin,
         
         self._login_path = login_path
         self._socket = socket
+        self._subprocess_env: Optional[dict] = None
         
         if self._login_path:
             self._extract_login_path_config()
@@ -152,11 +151,14 @@ class MysqlClient(ConnectionConfigMixin,
             self._messenger.error(f"✗ Error closing connection: {e}")
             self._logger.error(f"Error closing connection: {e}")
 
-    def validate_connection(self):
+    def validate_connection(self, deep: bool = False):
         try:
             if not self.is_connected:
                 return False
             
+            if not deep:
+                return True
+            
             if self._login_path:
                 result = subprocess.run(
                     ["mysql", f"--login-path={self._login_path}", "-e", "SELECT 1;", self._database],
@@ -174,26 +176,31 @@ class MysqlClient(ConnectionConfigMixin,
             return False
 
     def execute_query(self, query: str):
-        from services.execution.executor import QueryExecutor
-        query_executor = QueryExecutor(self, self._logger, self._messenger)
-        return query_executor.execute_query(query)
+        return self._query_executor.execute_query(query)
 
-    def extract_sql_query(self, query: str, outpath):
-        from services.execution.executor import QueryExecutor
-        from services.execution.exporter import QueryResultExporter
+    def extract_sql_query(self, query: str, outpath, server_side: bool = False, copy_mode: bool = False,
+                          compress: bool = False):
+        if server_side:
+            self._messenger.warning("Server-side export is only supported for PostgreSQL - using client-side export")
+        if copy_mode:
+            self._messenger.warning("COPY export is only supported for PostgreSQL - using client-side export")
 
-        query_executor = QueryExecutor(self, self._logger, self._messenger)
-        query_result_exporter = QueryResultExporter(
-            self._logger, self._messenger, self._database
-        )
+        query_executor = self._query_executor
+        query_result_exporter = self._query_result_exporter
         return query_executor.extract_sql_query(
-            query, outpath, query_result_exporter
+            query, outpath, query_result_exporter, compress=compress
         )
         
     @check_utility_available("xtrabackup")
-    def backup_full(self, outpath: str, single_archive: bool = True, storage: str = "local") -> bool:
+    def backup_full(self, outpath: str, single_archive: bool = True, storage: str = "local", verify: bool = False) -> bool:
         """Create full database backup with zstd compression"""
-        base_path = Path(outpath) if isinstance(outpath, str) else outpath
+        from services.backup.archive_utils import archive_backup
+        from utility.dir_size import dir_size
+        from utility.subprocess_pipeline import run_streaming
+
+        base_path = Path(outpath)
+        if verify:
+            self._messenger.warning("Manifest verification is only available for PostgreSQL backups")
         self._messenger.info(f"Starting full MySQL backup with xtrabackup → {base_path}")
         
         metadata = self._logger.start_backup(
@@ -206,7 +213,6 @@ class MysqlClient(ConnectionConfigMixin,
             storage=storage
         )
         
-        timestamp_start = datetime.fromisoformat(metadata["timestamp_start"].replace('Z', '+00:00'))
         backup_id = metadata["id"]
         
         backup_dir = base_path / backup_id
@@ -225,7 +231,8 @@ class MysqlClient(ConnectionConfigMixin,
             if self._socket:
                 xtrabackup_cmd.append(f"--socket={self._socket}")
             
-            env = os.environ.copy()
+            # xtrabackup reads credentials from ~/.mylogin.cnf; inherit the environment as is
+            env = None
             self._messenger.info(f"Using login-path '{self._login_path}' for xtrabackup authentication")
         else:
             xtrabackup_cmd = [
@@ -239,22 +246,18 @@ class MysqlClient(ConnectionConfigMixin,
                 "--compress-threads=4"
             ]
             
-            env = os.environ.copy()
-            env['MYSQL_PWD'] = self._password
+            if self._subprocess_env is None:
+                # Built once per client; Popen copies it into the child on every launch
+                self._subprocess_env = {**os.environ, 'MYSQL_PWD': self._password}
+            env = self._subprocess_env
         
         try:
             self._messenger.info("Running xtrabackup... (this may take a while)")
             
-            process = subprocess.run(
-                xtrabackup_cmd,
-                capture_output=True,
-                check=False,
-                text=True,
-                env=env
-            )
+            process = run_streaming(xtrabackup_cmd, env=env, on_line=self._logger.info)
             
             if process.returncode != 0:
-                error_msg = process.stderr or "Unknown error"
+                error_msg = process.stderr_tail or "Unknown error"
                 self._messenger.error(f"xtrabackup failed: {error_msg}")
                 self._logger.error(f"xtrabackup failed: {error_msg}")
                 self._logger.finish_backup(metadata, success=False)
@@ -267,7 +270,7 @@ class MysqlClient(ConnectionConfigMixin,
                 self._logger.finish_backup(metadata, success=False)
                 return False
             
-            total_size = sum(f.stat().st_size for f in backup_dir.rglob('*') if f.is_file())
+            total_size = dir_size(backup_dir)
             
             self._messenger.success(f"Full MySQL backup created at {backup_dir}")
             self._messenger.info(f"Backup size: {total_size / (1024**2):.2f} MB")
@@ -286,15 +289,7 @@ class MysqlClient(ConnectionConfigMixin,
                     self._logger.info(f"Binlog info: {binlog_info}")
             
             if single_archive:
-                self._messenger.section_header("Creating Single Archive (zstd)")
-                archive_path = create_single_archive(backup_dir, self._logger, self._messenger)
-                if archive_path:
-                    metadata["archive_path"] = str(archive_path)
-                    metadata["archive_format"] = "tar+zstd"
-                    metadata["archive_size_bytes"] = archive_path.stat().st_size
-                    self._messenger.success(f"✓ Single archive ready: {archive_path.name}")
-                else:
-                    self._messenger.warning("Single archive creation skipped/failed - backup remains as directory")
+                archive_backup(backup_dir, metadata, self._logger, self._messenger, original_size=total_size)
             
             self._logger.finish_backup(metadata, success=True)
             return True
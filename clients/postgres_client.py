@@ -1,23 +1,28 @@
 import os
+from contextlib import contextmanager
 from pathlib import Path
 import psycopg2
-from psycopg2.extensions import connection
-from datetime import datetime
+from psycopg2.extensions import connection, STATUS_READY
+from psycopg2.pool import ThreadedConnectionPool
 
 from mixins.backup_catalog_mixin import BackupCatalogMixin
 from mixins.conection_config_mixin import ConnectionConfigMixin
 from mixins.differential_mixin import DifferentialBackupMixin
 from factory import DatabaseClient
 from services.interfaces import IConnectionProvider
-from typing import Optional, Tuple, Any, List
+from typing import Iterator, Optional, Tuple, Any, List
 from decorators.types_decorators import not_none
-import subprocess
-from decorators.replication_privilege import _check_archive_mode, requires_replication_privilege, _check_wal_level
+from decorators.replication_privilege import requires_postgres_prerequisites
 from decorators.check_basebackup_decorator import check_basebackup
-import json
-from services.backup.archive_utils import create_single_archive
 from cli.postgres_wal_config import PostgresWalArchiveConfig
 
+# Server version strings keyed by (host, port, database); reused across reconnects
+# so only the first connection to a server pays for the `SELECT version()` round-trip.
+_SERVER_VERSION_CACHE: dict[Tuple[str, int, str], str] = {}
+
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+
 class PostgresClient(ConnectionConfigMixin,
                      BackupCatalogMixin,
                      DifferentialBackupMixin,
@@ -30,9 +35,13 @@ class PostgresClient(ConnectionConfigMixin,
         self._database_engine = "postgresql"
         
         self._use_pgpass = kwargs.pop('use_pgpass', False)
+        self._pool_max = kwargs.pop('pool_max', 8)
         
         super().__init__(host, database, user, password, **kwargs)
+        self._pool: Optional[ThreadedConnectionPool] = None
         self._connection: Optional[connection] = None
+        self._server_version_num: Optional[int] = None
+        self._subprocess_env: Optional[dict] = None
         
         self._archive_path: Optional[str] = None
         self._wal_config = PostgresWalArchiveConfig()
@@ -74,21 +83,39 @@ class PostgresClient(ConnectionConfigMixin,
             if not self._use_pgpass and self._password:
                 connect_kwargs["password"] = self._password
 
-            self._connection = psycopg2.connect(**connect_kwargs)
-            with self._connection.cursor() as cur:
-                cur.execute("SELECT version();")
-                
-                version_tuple: Optional[Tuple[Any, ...]] = cur.fetchone()
-                
+            if self._pool is None or self._pool.closed:
+                self._pool = ThreadedConnectionPool(1, self._pool_max, **connect_kwargs)
+            if self._connection is None or self._connection.closed:
+                # Session connection for backup prerequisites and strategies; short
+                # queries borrow their own connection via pooled_connection().
+                self._connection = self._pool.getconn()
+                # The session connection only runs single statements (prerequisite checks,
+                # LSN lookups, SQL console). Autocommit skips psycopg2's separate BEGIN/COMMIT
+                # round-trips and never leaves the session idle in a transaction after a SELECT.
+                self._connection.autocommit = True
+
+            # libpq reports server_version_num in the startup handshake; no query needed.
+            self._server_version_num = self._connection.server_version
+
+            cache_key = (self._host, self._port, self._database)
+            cached_version = _SERVER_VERSION_CACHE.get(cache_key)
+            if cached_version is None:
+                with self._connection.cursor() as cur:
+                    cur.execute("SELECT version();")
+                    version_tuple: Optional[Tuple[Any, ...]] = cur.fetchone()
+
                 if version_tuple is None:
                     self._logger.error("Failed fetch version from database")
                     return None
 
                 version: str = version_tuple[0]
-                self._database_version = version.split(',')[0]
-                self._messenger.success("PostgreSQL connection successful!")
-                self._messenger.info(f"  Server version: {self._database_version}")
-                self._logger.info(f"Connected to database: {self._database} ({self._database_version})")
+                cached_version = version.partition(',')[0]
+                _SERVER_VERSION_CACHE[cache_key] = cached_version
+
+            self._database_version = cached_version
+            self._messenger.success("PostgreSQL connection successful!")
+            self._messenger.info(f"  Server version: {self._database_version}")
+            self._logger.info(f"Connected to database: {self._database} ({self._database_version})")
             return self._connection
         
         except psycopg2.OperationalError as e:
@@ -99,8 +126,9 @@ class PostgresClient(ConnectionConfigMixin,
 
     def disconnect(self) -> None:
         try:
-            if self._connection and not self._connection.closed:
-                self._connection.close()
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+                self._pool = None
                 self._connection = None
                 self._messenger.info("Disconnected from database.")
                 self._logger.info("Database connection closed")
@@ -119,23 +147,34 @@ class PostgresClient(ConnectionConfigMixin,
     def get_connection(self) -> Optional[connection]:
         return self._connection
 
-    @not_none('query')
-    def _execute(self, query: str) -> Any:
-        if self._connection is None:
+    @contextmanager
+    def pooled_connection(self) -> Iterator[connection]:
+        """Borrow a pooled connection; commits on success and rolls back on error."""
+        if self._pool is None or self._pool.closed:
             raise RuntimeError("No active database connection")
-        cur = self._connection.cursor()
-        cur.execute(query)
-        return cur
+        conn = self._pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self._pool.putconn(conn)
+
+    @not_none('query')
+    def _execute(self, query: str, fetch_one: bool = False) -> Any:
+        with self.pooled_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query)
+                if cur.description is None:
+                    return None
+                return cur.fetchone() if fetch_one else cur.fetchall()
 
     @not_none('query')
     def fetch_all(self, query: str) -> list[Any]:
-        cur = self._execute(query)
-        return cur.fetchall()
+        return self._execute(query) or []
 
     @not_none('query')
     def fetch_one(self, query: str) -> Optional[Tuple[Any, ...]]:
-        cur = self._execute(query)
-        return cur.fetchone()
+        return self._execute(query, fetch_one=True)
 
     def commit(self) -> None:
         if self._connection is None:
@@ -147,10 +186,16 @@ class PostgresClient(ConnectionConfigMixin,
             raise RuntimeError("No active database connection")
         self._connection.rollback()
 
-    def validate_connection(self) -> bool:
+    def validate_connection(self, deep: bool = False) -> bool:
+        """
+        Check the connection using libpq's local status; no network round-trip.
+        Falls back to `SELECT 1` when deep=True or the connection is mid-transaction.
+        """
         try:
             if not self._connection or self._connection.closed:
                 return False
+            if not deep and self._connection.status == STATUS_READY:
+                return True
             with self._connection.cursor() as cur:
                 cur.execute("SELECT 1;")
                 result = cur.fetchone()
@@ -160,30 +205,55 @@ class PostgresClient(ConnectionConfigMixin,
 
     @not_none('query')
     def execute_query(self, query: str) -> Any:
-        from services.execution.executor import QueryExecutor
-        query_executor = QueryExecutor(self, self._logger, self._messenger)
-        return query_executor.execute_query(query)
+        return self._query_executor.execute_query(query)
 
     @not_none('query')
-    def extract_sql_query(self, query: str, outpath):
-        from services.execution.executor import QueryExecutor
-        from services.execution.exporter import QueryResultExporter
+    def preview_query(self, query: str, limit: int = 10) -> Any:
+        from services.execution.executor import is_select
+        if not is_select(query):
+            return super().preview_query(query, limit)
+        # Named cursors need a transaction; the session connection runs in autocommit
+        return self._query_executor.preview_query(query, limit, self.pooled_connection)
 
-        query_executor = QueryExecutor(self, self._logger, self._messenger)
-        query_result_exporter = QueryResultExporter(
-            self._logger, self._messenger, self._database
-        )
+    def _get_subprocess_env(self) -> dict:
+        """Environment for pg_basebackup, built once per client; Popen copies it into the child."""
+        if self._subprocess_env is None:
+            env = {key: value for key, value in os.environ.items() if key != 'PGPASSWORD'}
+            if not self._use_pgpass:
+                env['PGPASSWORD'] = self._password
+            self._subprocess_env = env
+        return self._subprocess_env
+
+    @property
+    def is_local_server(self) -> bool:
+        """True when the server runs on this host (TCP loopback or a Unix socket)."""
+        return not self._host or self._host.startswith('/') or self._host in _LOCAL_HOSTS
+
+    @not_none('query')
+    def extract_sql_query(self, query: str, outpath, server_side: bool = False, copy_mode: bool = False,
+                          compress: bool = False):
+        if server_side and not self.is_local_server:
+            self._messenger.warning("Server-side export needs a local server - using client-side export")
+            self._logger.warning(f"Server-side export skipped for remote host {self._host}")
+            server_side = False
+
+        query_executor = self._query_executor
+        query_result_exporter = self._query_result_exporter
         return query_executor.extract_sql_query(
-            query, outpath, query_result_exporter
+            query, outpath, query_result_exporter, server_side=server_side, copy_mode=copy_mode,
+            compress=compress, connection_factory=self.pooled_connection,
         )
     
-    @_check_archive_mode
-    @_check_wal_level
+    @requires_postgres_prerequisites(replication=True, wal_level=True, archive_mode=True)
     @check_basebackup
-    @requires_replication_privilege
-    def backup_full(self, outpath: str, single_archive: bool = True, storage = 'local') -> bool:
+    def backup_full(self, outpath: str, single_archive: bool = True, storage = 'local', verify: bool = False) -> bool:
         """Create full database backup with zstd compression"""
-        base_path = Path(outpath) if isinstance(outpath, str) else outpath
+        from services.backup.archive_utils import archive_backup
+        from services.backup.manifest_verification import verify_backup_manifest
+        from utility.json_io import write_json
+        from utility.subprocess_pipeline import run_streaming
+
+        base_path = Path(outpath)
         self._messenger.info(f"Starting full backup → {base_path}")
         
         metadata = self._logger.start_backup(
@@ -196,7 +266,6 @@ class PostgresClient(ConnectionConfigMixin,
             storage=storage
         )
         
-        timestamp_start = datetime.fromisoformat(metadata["timestamp_start"].replace('Z', '+00:00'))
         backup_id = metadata["id"]
         
         backup_dir = base_path / backup_id
@@ -214,37 +283,37 @@ class PostgresClient(ConnectionConfigMixin,
             "-P", 
             "-v",
             '-l', f"UTIL_FULL_{backup_id}", 
-            '--manifest-checksums=SHA256' 
         ]
+
+        # Backup manifests exist from PostgreSQL 13 onwards
+        supports_manifest = (self._server_version_num or 0) >= 130000
+        if supports_manifest:
+            pg_basebackup_cmd.append('--manifest-checksums=SHA256')
+        elif verify:
+            self._messenger.warning("Manifest verification needs PostgreSQL 13+ - skipping -verify")
+            self._logger.warning(f"Manifest verification skipped: server_version_num={self._server_version_num}")
+            verify = False
         
         if hasattr(self, '_compressing_level') and self._compressing_level:
             pg_basebackup_cmd.extend(["-z", "-Z", str(self._compressing_level)])
         else:
             pg_basebackup_cmd.extend(["-z", "-Z", "6"])
         
-        env = os.environ.copy()
+        env = self._get_subprocess_env()
         
         if self._use_pgpass:
-            env.pop('PGPASSWORD', None)
             self._messenger.info("Using PostgreSQL .pgpass for authentication")
             metadata["auth_method"] = "pgpass"
         else:
-            env['PGPASSWORD'] = self._password
             metadata["auth_method"] = "password"
         
         try:
             self._messenger.info("Running pg_basebackup... (this may take a while)")
             
-            process = subprocess.run(
-                pg_basebackup_cmd,
-                capture_output=True,
-                env=env,
-                check=False,
-                text=True
-            )
+            process = run_streaming(pg_basebackup_cmd, env=env, on_line=self._messenger.info)
             
             if process.returncode != 0:
-                error_msg = process.stderr or "Unknown error"
+                error_msg = process.stderr_tail or "Unknown error"
                 self._messenger.error(f"pg_basebackup failed: {error_msg}")
                 self._logger.error(f"pg_basebackup failed: {error_msg}")
                 self._logger.finish_backup(metadata, success=False)
@@ -265,11 +334,21 @@ class PostgresClient(ConnectionConfigMixin,
                 metadata["backup_manifest_path"] = str(manifest_path)
                 self._messenger.success(f"Backup manifest found at {manifest_path}")
                 self._logger.info(f"Backup manifest path: {manifest_path}")
+                if verify:
+                    metadata["manifest_verified"] = verify_backup_manifest(
+                        backup_dir, self._logger, self._messenger
+                    )
+                    if not metadata["manifest_verified"]:
+                        self._logger.finish_backup(metadata, success=False)
+                        return False
             else:
                 self._messenger.warning("Backup manifest not found (PostgreSQL < 13)")
                 metadata["backup_manifest_path"] = ""
             
-            total_size = sum(f.stat().st_size for f in backup_dir.rglob('*') if f.is_file())
+            # Tar format leaves only flat archives (base, pg_wal, tablespaces) and the
+            # manifest in backup_dir, so one scandir gives the size without a tree walk.
+            with os.scandir(backup_dir) as entries:
+                total_size = sum(e.stat().st_size for e in entries if e.is_file())
             
             self._messenger.success(f"Full backup created at {backup_dir}")
             self._messenger.info(f"Files: base.tar.gz, pg_wal.tar.gz")
@@ -283,20 +362,11 @@ class PostgresClient(ConnectionConfigMixin,
             metadata["backup_format"] = "tar+gzip"
             
             metadata_file = backup_dir / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            write_json(metadata_file, metadata)
             self._messenger.info(f"Metadata saved: {metadata_file}")
             
             if single_archive:
-                self._messenger.section_header("Creating Single Archive (zstd)")
-                archive_path = create_single_archive(backup_dir, self._logger, self._messenger)
-                if archive_path:
-                    metadata["archive_path"] = str(archive_path)
-                    metadata["archive_format"] = "tar+zstd"
-                    metadata["archive_size_bytes"] = archive_path.stat().st_size
-                    self._messenger.success(f"✓ Single archive ready: {archive_path.name}")
-                else:
-                    self._messenger.warning("Single archive creation skipped/failed - backup remains as directory")
+                archive_backup(backup_dir, metadata, self._logger, self._messenger, original_size=total_size)
             
             self._logger.finish_backup(metadata, success=True)
             return True
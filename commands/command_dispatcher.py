@@ -1,6 +1,21 @@
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+
+_COMMAND_MAP = MappingProxyType({
+    "full database": "full_backup",
+    "differential backup": "differential_backup",
+    "help": "help",
+})
+
+# Commands whose first word selects the handler and whose remainder is its argument.
+_PREFIX_MAP = MappingProxyType({
+    "sql": "execute_sql",
+})
+
+
 class CommandDispatcher:
-    def __init__(self, storage_type: str = "local"):
-        self.commands = {}
+    def __init__(self, storage_type: str = "local", commands: Optional[Mapping[str, Callable]] = None):
+        self.commands = {name.lower(): handler for name, handler in (commands or {}).items()}
         self.storage_type = storage_type  
         
     def register_command(self, command_name: str, handler):
@@ -8,20 +23,14 @@ class CommandDispatcher:
         
     def dispatch(self, command_name: str, parsed_args):
         """Dispatch command with parsed arguments"""
-        command_name = command_name.lower()
-        
-        command_mapping = {
-            "full database": "full_backup",
-            "differential backup": "differential_backup",
-            "help": "help"
-        }
+        head, _, rest = command_name.partition(" ")
+        head = head.lower()
+        if rest and head in _PREFIX_MAP:
+            # Only the keyword is case-insensitive; the argument (e.g. SQL text) is passed as typed
+            return self.execute_command(_PREFIX_MAP[head], rest.strip(), parsed_args)
         
-        if command_name.startswith("sql "):
-            mapped_command = "execute_sql"
-            sql_query = command_name[4:].strip() 
-            return self.execute_command(mapped_command, sql_query, parsed_args)
-        
-        mapped_command = command_mapping.get(command_name, command_name)
+        command_name = command_name.lower()
+        mapped_command = _COMMAND_MAP.get(command_name, command_name)
         
         if mapped_command not in self.commands:
             raise ValueError(f"Command '{command_name}' not recognized.")
@@ -1,40 +1,66 @@
+import sys
+
+from colorama import Fore, Style
+
 from .command_dispatcher import CommandDispatcher
 from services.backup_services import BackupService
-from console_utils import MessageLevel
+
+
+def _heading(text: str) -> str:
+    return f"{Fore.CYAN}{text}{Style.RESET_ALL}\n"
+
+
+_HELP_TITLE = "Database Backup Utility"
+
+# Static, so rendered once and written in a single call
+_HELP_TEXT = "".join([
+    _heading("\n" + "=" * len(_HELP_TITLE)),
+    _heading(_HELP_TITLE),
+    _heading("=" * len(_HELP_TITLE)),
+    f"{Fore.GREEN}✓ Available commands:{Style.RESET_ALL}\n",
+    "\n",
+    _heading("1) Full backup:"),
+    "   full database -path <destination_path>\n",
+    "   Example: full database -path /backups/postgres\n",
+    "   Quote paths that contain spaces: -path \"/backups/My Backups\"\n",
+    "   Note: Creates a physical full backup using the utility for the selected database\n",
+    "   Add -verify to check every file against backup_manifest (PostgreSQL)\n",
+    "\n",
+    _heading("2) Differential backup:"),
+    "   differential backup\n",
+    "   Example: differential backup\n",
+    "   Note: PostgreSQL copies archived WAL files; MySQL runs xtrabackup incremental\n",
+    "\n",
+    _heading("3) Execute SQL:"),
+    "   SQL <your_sql_query>\n",
+    "   Example: SQL SELECT * FROM users WHERE id < 100\n",
+    "\n",
+    _heading("4) SQL + export to CSV:"),
+    "   SQL <your_sql_query> -extract -path <destination_path>\n",
+    "   Example: SQL SELECT * FROM users -extract -path /exports\n",
+    "   Add -server-side to compress on a local PostgreSQL server (COPY TO PROGRAM, superuser)\n",
+    "   Add -copy-mode to stream the result over the COPY protocol instead of fetching rows\n",
+    "   Add -compress true to compress the CSV with zstd while it is written (.csv.zst)\n",
+    "\n",
+    _heading("5) Exit:"),
+    "   exit | quit\n",
+    "\n",
+])
+
 
 def build_dispatcher(db_client, messenger,  storage_type: str = "local"):
-    dispatcher = CommandDispatcher(storage_type = storage_type)
     backup_service = BackupService(db_client)
     
     def help_command(parsed_args):
-        messenger.section_header("Database Backup Utility")
-        messenger.success("Available commands:")
-        print()
-        messenger.print_colored("1) Full backup:", MessageLevel.INFO)
-        print("   full database -path <destination_path>")
-        print("   Example: full database -path /backups/postgres")
-        print("   Note: Creates a physical full backup using the utility for the selected database")
-        print()
-        messenger.print_colored("2) Differential backup:", MessageLevel.INFO)
-        print("   differential backup")
-        print("   Example: differential backup")
-        print("   Note: PostgreSQL copies archived WAL files; MySQL runs xtrabackup incremental")
-        print()
-        messenger.print_colored("3) Execute SQL:", MessageLevel.INFO)
-        print("   SQL <your_sql_query>")
-        print("   Example: SQL SELECT * FROM users WHERE id < 100")
-        print()
-        messenger.print_colored("4) SQL + export to CSV:", MessageLevel.INFO)
-        print("   SQL <your_sql_query> -extract -path <destination_path>")
-        print("   Example: SQL SELECT * FROM users -extract -path /exports")
-        print()
-        messenger.print_colored("5) Exit:", MessageLevel.INFO)
-        print("   exit | quit")
-        print()
-    
-    dispatcher.register_command("full_backup", backup_service.full_backup)
-    dispatcher.register_command("differential_backup", backup_service.differential_backup)
-    dispatcher.register_command("execute_sql", backup_service.execute_sql)
-    dispatcher.register_command("help", help_command)
+        sys.stdout.write(_HELP_TEXT)
+        sys.stdout.flush()
     
-    return dispatcher
+    return CommandDispatcher(
+        storage_type=storage_type,
+        commands={
+            "full_backup": backup_service.full_backup,
+            "differential_backup": backup_service.differential_backup,
+            "execute_sql": backup_service.execute_sql,
+            "help": help_command,
+        },
+    )
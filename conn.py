@@ -29,7 +29,7 @@ def validate_pg_connection(dbname, user, host, password, port):
             cur.execute("SELECT version();")
             version = cur.fetchone()[0]
             print(Fore.GREEN + f"✓ PostgreSQL connection successful!" + Style.RESET_ALL)
-            print(Fore.CYAN + f"  Server version: {version.split(',')[0]}" + Style.RESET_ALL)
+            print(Fore.CYAN + f"  Server version: {version.partition(',')[0]}" + Style.RESET_ALL)
         
         return conn
     except psycopg2.OperationalError as e:
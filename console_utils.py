@@ -1,8 +1,13 @@
 import logging
+import sys
+from contextlib import contextmanager
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterator, Optional, Sequence
 from colorama import Fore, Style
 
+from utility.log_batch import LogBatch
+
 class MessageLevel(Enum):
     INFO = "info"
     SUCCESS = "success"
@@ -13,49 +18,72 @@ class MessageLevel(Enum):
 
 class ConsoleMessenger:
     """Centralized messaging system that handles both colored console output and logging"""
+
+    _COLOR_MAP = MappingProxyType({
+        MessageLevel.INFO: Fore.CYAN,
+        MessageLevel.SUCCESS: Fore.GREEN,
+        MessageLevel.WARNING: Fore.YELLOW,
+        MessageLevel.ERROR: Fore.RED,
+        MessageLevel.DEBUG: Fore.MAGENTA,
+        MessageLevel.CRITICAL: Fore.RED + Style.BRIGHT,
+    })
+    _LOG_LEVEL_MAP = MappingProxyType({
+        MessageLevel.INFO: logging.INFO,
+        MessageLevel.SUCCESS: logging.INFO,
+        MessageLevel.WARNING: logging.WARNING,
+        MessageLevel.ERROR: logging.ERROR,
+        MessageLevel.DEBUG: logging.DEBUG,
+        MessageLevel.CRITICAL: logging.CRITICAL,
+    })
     
     def __init__(self, logger: Optional[logging.Logger] = None, enable_colors: bool = True):
         self.logger = logger
         self.enable_colors = enable_colors
-        self._color_map = {
-            MessageLevel.INFO: Fore.CYAN,
-            MessageLevel.SUCCESS: Fore.GREEN,
-            MessageLevel.WARNING: Fore.YELLOW,
-            MessageLevel.ERROR: Fore.RED,
-            MessageLevel.DEBUG: Fore.MAGENTA,
-            MessageLevel.CRITICAL: Fore.RED + Style.BRIGHT,
-        }
-        self._log_level_map = {
-            MessageLevel.INFO: logging.INFO,
-            MessageLevel.SUCCESS: logging.INFO,
-            MessageLevel.WARNING: logging.WARNING,
-            MessageLevel.ERROR: logging.ERROR,
-            MessageLevel.DEBUG: logging.DEBUG,
-            MessageLevel.CRITICAL: logging.CRITICAL,
+        self._batch: Optional[LogBatch] = None
+        # Per-level (prefix, suffix) so colouring a message is a plain concatenation
+        self._wrap = {
+            level: (self._COLOR_MAP[level], Style.RESET_ALL) if enable_colors else ("", "")
+            for level in MessageLevel
         }
 
     def _get_colored_message(self, message: str, level: MessageLevel) -> str:
         """Apply color formatting to message if colors are enabled"""
-        if not self.enable_colors:
-            return message
-        
-        color = self._color_map.get(level, "")
-        return f"{color}{message}{Style.RESET_ALL}"
+        prefix, suffix = self._wrap[level]
+        return prefix + message + suffix
 
     def _log_to_file(self, message: str, level: MessageLevel) -> None:
         """Log message to file if logger is available"""
         if not self.logger:
             return
             
-        log_level = self._log_level_map.get(level, logging.INFO)
+        log_level = self._LOG_LEVEL_MAP.get(level, logging.INFO)
         self.logger.log(log_level, message)
 
     def print_colored(self, message: str, level: MessageLevel = MessageLevel.INFO) -> None:
         """Print colored message to console and optionally log to file"""
         colored_message = self._get_colored_message(message, level)
+        if self._batch is not None:
+            if level in (MessageLevel.INFO, MessageLevel.SUCCESS):
+                self._batch.add(self.logger, message, colored_message)
+                return
+            self._batch.flush()
         print(colored_message)
         
-        self._log_to_file(message, level)
+        if self.logger:
+            self._log_to_file(message, level)
+
+    @contextmanager
+    def batched(self, batch: Optional[LogBatch] = None) -> Iterator[LogBatch]:
+        """Queue info/success messages into `batch` (a new one if omitted) until the block exits."""
+        if self._batch is not None:
+            yield self._batch
+            return
+        self._batch = batch if batch is not None else LogBatch()
+        try:
+            yield self._batch
+        finally:
+            self._batch.flush()
+            self._batch = None
 
     def info(self, message: str) -> None:
         """Print info message"""
@@ -109,15 +137,21 @@ def configure_messenger(logger: Optional[logging.Logger] = None, enable_colors:
     global _global_messenger
     _global_messenger = ConsoleMessenger(logger=logger, enable_colors=enable_colors)
 
+_LEGACY_LEVEL_MAPPING = MappingProxyType({level.value: level for level in MessageLevel})
+
 def print_colored(message: str, level: str = "info") -> None:
     """Legacy function for backward compatibility"""
-    level_mapping = {
-        "info": MessageLevel.INFO,
-        "success": MessageLevel.SUCCESS,
-        "warning": MessageLevel.WARNING,
-        "error": MessageLevel.ERROR,
-        "debug": MessageLevel.DEBUG,
-        "critical": MessageLevel.CRITICAL,
-    }
-    msg_level = level_mapping.get(level.lower(), MessageLevel.INFO)
+    msg_level = _LEGACY_LEVEL_MAPPING.get(level.lower(), MessageLevel.INFO)
     get_messenger().print_colored(message, msg_level)
+
+def print_sql_preview(rows: Sequence, limit: int = 10, messenger: Optional[ConsoleMessenger] = None) -> None:
+    """Print the first `limit` rows of a query preview in a single write."""
+    if not rows:
+        (messenger or get_messenger()).warning("No rows returned")
+        return
+    lines = [str(row) for row in rows[:limit]]
+    if len(rows) > limit:
+        lines.append("... more rows hidden")
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
@@ -1,25 +1,37 @@
-import json
 import logging
+import logging.handlers
+from contextlib import contextmanager
 from logging import getLoggerClass
 import os
-from typing import Any, Dict, Optional
-import uuid
+import time
+from typing import Any, Dict, Iterator, Optional
 from datetime import datetime, timezone
 
+from utility.json_io import dumps_json, loads_json
+from utility.log_batch import LogBatch
+
 OriginalLogger = getLoggerClass()
 
+_BACKUP_ID_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
 def generate_backup_id(backup_type: str, database: str, timestamp: datetime) -> str:
-    timestamp_format = "%Y%m%d_%H%M%S"
-    suffix = uuid.uuid4().hex[:4]
-    return f"{backup_type}_{database}_{timestamp.strftime(timestamp_format)}_{suffix}"
+    suffix = os.urandom(2).hex()
+    return f"{backup_type}_{database}_{timestamp.strftime(_BACKUP_ID_TIMESTAMP_FORMAT)}_{suffix}"
 
 class BackupLogger:
     def __init__(self, name: str = "backup", log_file: str = "backup.log", level: int = logging.INFO):
+        self._batch: Optional[LogBatch] = None
+        # time.monotonic() at start_backup, keyed by backup id, so durations need no ISO parsing
+        self._started_at: Dict[str, float] = {}
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        for handler in self.logger.handlers:
+            handler.flush()
         self.logger.handlers.clear()
 
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=10_000_000, backupCount=5, encoding="utf-8"
+        )
         file_handler.setLevel(level)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
@@ -31,7 +43,13 @@ class BackupLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
+        # Records reach the file in batches; errors and finish_backup() flush immediately
+        self._file_buffer = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        self._file_buffer.setLevel(level)
+
+        self.logger.addHandler(self._file_buffer)
         self.logger.addHandler(console_handler)
 
         self.catalog = BackupCatalog()
@@ -48,6 +66,7 @@ class BackupLogger:
     ) -> Dict[str, Any]:
         timestamp_start = datetime.now(timezone.utc)
         backup_id = generate_backup_id(backup_type, database, timestamp_start)
+        self._started_at[backup_id] = time.monotonic()
         parent_backup_id = None
         base_backup_id = None
 
@@ -92,8 +111,11 @@ class BackupLogger:
 
     def finish_backup(self, metadata: Dict[str, Any], success: bool = True) -> None:
         timestamp_end = datetime.now(timezone.utc)
-        timestamp_start = datetime.fromisoformat(metadata["timestamp_start"])
-        duration = (timestamp_end - timestamp_start).total_seconds()
+        started_at = self._started_at.pop(metadata["id"], None)
+        if started_at is not None:
+            duration = time.monotonic() - started_at
+        else:
+            duration = (timestamp_end - datetime.fromisoformat(metadata["timestamp_start"])).total_seconds()
 
         metadata["timestamp_end"] = timestamp_end.isoformat()
         metadata["duration_seconds"] = duration
@@ -113,6 +135,7 @@ class BackupLogger:
             )
         else:
             self.logger.error(f"Backup failed: {metadata['id']}")
+        self._file_buffer.flush()
 
     def log_table_backup(self, metadata: Dict[str, Any], table_name: str, rows_count: int, file_size: int, file_path: str) -> None:
         metadata["tables"][table_name] = {
@@ -125,66 +148,133 @@ class BackupLogger:
         metadata["statistics"]["total_size_bytes"] += file_size
         self.logger.info(f"Table {table_name}: {rows_count} rows, {file_size / 1024:.2f} KB")
 
+    @contextmanager
+    def batched(self, batch: Optional[LogBatch] = None) -> Iterator[LogBatch]:
+        """Queue info messages into `batch` (a new one if omitted) until the block exits."""
+        if self._batch is not None:
+            yield self._batch
+            return
+        self._batch = batch if batch is not None else LogBatch()
+        try:
+            yield self._batch
+        finally:
+            self._batch.flush()
+            self._batch = None
+
     def info(self, message: str) -> None:
+        if self._batch is not None:
+            self._batch.add(self.logger, message)
+            return
         self.logger.info(message)
 
     def warning(self, message: str) -> None:
+        if self._batch is not None:
+            self._batch.flush()
         self.logger.warning(message)
 
-    def error(self, message: str) -> None:
-        self.logger.error(message)
+    def error(self, message: str, exc_info: bool = False) -> None:
+        if self._batch is not None:
+            self._batch.flush()
+        self.logger.error(message, exc_info=exc_info)
 
 class BackupCatalog:
-    def __init__(self, path: str = "backup_catalog.json"):
+    """
+    Backup history stored as append-only JSON Lines, one backup record per line.
+
+    Records are indexed in memory on load: by id, plus the newest record overall and
+    the newest completed record per backup type, so lookups do not scan the history
+    and add_backup writes a single line instead of rewriting the file. A legacy
+    `backup_catalog.json` next to the JSONL file is migrated on first load.
+    """
+
+    def __init__(self, path: str = "backup_catalog.jsonl"):
         if not isinstance(path, str):
             raise ValueError("The catalog path must be a string.")
-        if not path.endswith(".json"):
-            raise ValueError("The catalog file must be a JSON file.")
+        if not path.endswith(".jsonl"):
+            raise ValueError("The catalog file must be a JSONL file.")
         self.catalog_path = path
         self.logger = logging.getLogger("BackupCatalog")
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._last: Optional[Dict[str, Any]] = None
+        self._last_completed_by_type: Dict[str, Dict[str, Any]] = {}
         self.catalog = self.load()
 
+    def _index(self, backup: Dict[str, Any]) -> None:
+        timestamp = backup.get("timestamp_start", "")
+        if "id" in backup:
+            self._by_id[backup["id"]] = backup
+        if self._last is None or timestamp > self._last.get("timestamp_start", ""):
+            self._last = backup
+        if backup.get("status") == "completed":
+            backup_type = backup.get("type")
+            current = self._last_completed_by_type.get(backup_type)
+            if current is None or timestamp > current.get("timestamp_start", ""):
+                self._last_completed_by_type[backup_type] = backup
+
+    def _load_legacy(self, legacy_path: str) -> Optional[list]:
+        """Migrate a pre-JSONL catalog; None when there is none."""
+        try:
+            with open(legacy_path, "rb") as f:
+                backups = loads_json(f.read()).get("backups", [])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as e:
+            self.logger.error(f"Failed to migrate legacy catalog {legacy_path}: {e}")
+            return []
+        with open(self.catalog_path, "wb") as f:
+            f.writelines(dumps_json(backup, indent=None) + b"\n" for backup in backups)
+        self.logger.warning(f"Migrated {len(backups)} backups from {legacy_path} to {self.catalog_path}.")
+        return backups
+
     def load(self) -> Dict[str, Any]:
-        if not os.path.exists(self.catalog_path):
-            self.logger.warning(f"Catalog file not found. Creating a new catalog at {self.catalog_path}.")
-            return {"backups": []}
+        backups = []
         try:
-            with open(self.catalog_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, ValueError) as e:
-            self.logger.error(f"Failed to load catalog file: {e}. Creating a new catalog at {self.catalog_path}.")
-            return {"backups": []}
+            f = open(self.catalog_path, "rb")
+        except FileNotFoundError:
+            migrated = self._load_legacy(self.catalog_path[:-1])
+            if migrated is None:
+                self.logger.warning(f"Catalog file not found. Creating a new catalog at {self.catalog_path}.")
+            else:
+                backups = migrated
+        else:
+            with f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        backups.append(loads_json(line))
+                    except ValueError as e:
+                        self.logger.error(f"Skipping corrupt catalog line {line_number}: {e}")
+
+        for backup in backups:
+            self._index(backup)
+        return {"backups": backups}
 
     def save(self) -> None:
+        """Rewrite the whole catalog file; add_backup only appends."""
         if not isinstance(self.catalog, dict):
             raise ValueError("The catalog must be a dictionary.")
-        with open(self.catalog_path, "w", encoding="utf-8") as f:
-            json.dump(self.catalog, f, indent=4, ensure_ascii=False)
+        with open(self.catalog_path, "wb") as f:
+            f.writelines(dumps_json(backup, indent=None) + b"\n" for backup in self.catalog.get("backups", []))
 
     def add_backup(self, new_backup: Dict[str, Any]) -> None:
         if not isinstance(new_backup, dict):
             raise ValueError("The new backup must be a dictionary.")
-        if "backups" not in self.catalog:
-            self.catalog["backups"] = []
-        self.catalog["backups"].append(new_backup)
-        self.save()
+        line = dumps_json(new_backup, indent=None) + b"\n"
+        with open(self.catalog_path, "ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.catalog.setdefault("backups", []).append(new_backup)
+        self._index(new_backup)
 
     def get_last_backup(self) -> Optional[Dict[str, Any]]:
-        backups = self.catalog.get("backups", [])
-        if not isinstance(backups, list):
-            raise ValueError("The backups must be a list.")
-        if not backups:
-            return None
-        return max(backups, key=lambda b: b.get("timestamp_start", ""))
+        return self._last
 
     def get_last_successful_backup(self) -> Optional[Dict[str, Any]]:
-        backups = self.catalog.get("backups", [])
-        if not isinstance(backups, list):
-            raise ValueError("The backups must be a list.")
-        filtered = [b for b in backups if b.get("status") == "completed"]
-        if not filtered:
+        if not self._last_completed_by_type:
             return None
-        return max(filtered, key=lambda b: b.get("timestamp_start", ""))
+        return max(self._last_completed_by_type.values(), key=lambda b: b.get("timestamp_start", ""))
 
     def get_last_backup_id(self) -> Optional[str]:
         last = self.get_last_backup()
@@ -193,29 +283,24 @@ class BackupCatalog:
     def get_last_backup_by_type(self, backup_type: str) -> Optional[Dict[str, Any]]:
         if not isinstance(backup_type, str):
             raise ValueError("The backup type must be a string.")
-        backups = self.catalog.get("backups", [])
-        if not isinstance(backups, list):
-            raise ValueError("The backups must be a list.")
-        filtered = [b for b in backups if b.get("type") == backup_type and b.get("status") == "completed"]
-        if not filtered:
-            return None
-        return max(filtered, key=lambda b: b.get("timestamp_start", ""))
+        return self._last_completed_by_type.get(backup_type)
 
     def get_last_full_backup(self) -> Optional[Dict[str, Any]]:
         return self.get_last_backup_by_type("full")
 
     def get_backup_chain(self, backup_id: str) -> list[Dict[str, Any]]:
-        backups = self.catalog.get("backups", [])
-        target = next((b for b in backups if b.get("id") == backup_id), None)
+        target = self._by_id.get(backup_id)
         if not target:
             return []
         chain = [target]
+        seen = {backup_id}
         current = target
         while current.get("parent_backup_id") or current.get("base_backup_id"):
             parent_id = current.get("parent_backup_id") or current.get("base_backup_id")
-            parent = next((b for b in backups if b.get("id") == parent_id), None)
-            if not parent:
+            parent = self._by_id.get(parent_id)
+            if not parent or parent_id in seen:
                 break
+            seen.add(parent_id)
             chain.insert(0, parent)
             current = parent
         return chain
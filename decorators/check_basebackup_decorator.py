@@ -1,5 +1,6 @@
 from functools import wraps
-import shutil
+
+from decorators.utility_available import find_utility
 
 
 def check_basebackup(func):
@@ -7,7 +8,7 @@ def check_basebackup(func):
     @wraps(func)
     def wrapper(self, *args, **kwargs) -> bool:
         try:
-            if not shutil.which("pg_basebackup"):
+            if not find_utility("pg_basebackup"):
                 self._messenger.error("pg_basebackup utility is not installed or not found in PATH.")
                 self._logger.error("pg_basebackup utility is missing.")
                 return False
@@ -1,105 +1,140 @@
 from functools import wraps
+from typing import Any, Dict, Optional
+from weakref import WeakKeyDictionary
 
-def requires_replication_privilege(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs) -> bool:
-        query = "SELECT rolreplication FROM pg_roles WHERE rolname = %s;"
-        
-        has_privilege = False
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, (self._user,))
-                result = cursor.fetchone()
-                
-                if result and result[0] is True:
-                    has_privilege = True
-                    self._messenger.success("Replication privilege confirmed.")
-                    self._logger.info(f"User '{self._user}' has replication privileges.")
-                else:
-                    self._messenger.error(
-                        f"User '{self._user}' does not have REPLICATION privilege."
-                        f"\nINSTRUCTION: Run 'ALTER ROLE {self._user} WITH REPLICATION;' as a superuser."
-                    )
-                    self._logger.error(f"Replication privilege check failed for user '{self._user}'.")
-        except Exception as e:
-            self._messenger.error(f"Failed to check replication privilege: {e}")
-            self._logger.error(f"Failed to check replication privilege: {e}")
-            return False
-
-        if not has_privilege:
-            return False
-        
-        return func(self, *args, **kwargs)
-    
-    return wrapper
-
-def _check_wal_level(func):
-    @wraps(func)
-    def wrapper(self, *args, **kwargs) -> bool:
-        query = "SHOW wal_level;"
-        
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query)
-                result = cursor.fetchone()
-                level = result[0] if result else None
-                
-                if level in ('replica', 'logical', 'archive'):
-                    self._messenger.success(f"wal_level is set to '{level}'.")
-                    self._logger.info(f"wal_level check passed: '{level}'.")
-                    return func(self, *args, **kwargs)
-                else:
-                    self._messenger.error(
-                        f"wal_level is set to '{level}'. It must be 'replica' or higher for replication."
-                        "\nINSTRUCTION: Set wal_level to 'replica' or higher in postgresql.conf and restart the server."
-                    )
-                    self._logger.error(f"wal_level check failed: '{level}'.")
-                    return False
-
-        except Exception as e:
-            self._messenger.error(f"Failed to check wal_level: {e}")
-            self._logger.error(f"Failed to check wal_level: {e}")
-            return False
-    
-    return wrapper
-
-
-
-def _check_archive_mode(func):
+from psycopg2 import sql
+
+_PREREQUISITES_QUERY = (
+    "SELECT current_setting('wal_level'), current_setting('archive_mode'), "
+    "(SELECT rolreplication FROM pg_roles WHERE rolname = %s);"
+)
+
+# Backup prerequisites per connection, fetched in one round-trip by whichever check
+# runs first. A new connection starts empty; a failed check drops the entry so the
+# next call sees configuration or role changes made in the meantime.
+_PREREQUISITES: "WeakKeyDictionary[Any, Dict[str, Any]]" = WeakKeyDictionary()
+
+
+def _load_prerequisites(self) -> Dict[str, Any]:
+    """wal_level, archive_mode and the user's REPLICATION attribute for self.connection."""
+    connection = self.connection
+    try:
+        cached: Optional[Dict[str, Any]] = _PREREQUISITES.get(connection)
+    except TypeError:
+        cached = None
+    if cached is not None and cached["user"] == self._user:
+        return cached
+
+    with connection.cursor() as cursor:
+        cursor.execute(_PREREQUISITES_QUERY, (self._user,))
+        wal_level, archive_mode, rolreplication = cursor.fetchone()
+
+    prerequisites = {
+        "user": self._user,
+        "wal_level": wal_level,
+        "archive_mode": archive_mode,
+        "rolreplication": rolreplication,
+    }
+    try:
+        _PREREQUISITES[connection] = prerequisites
+    except TypeError:
+        pass
+    return prerequisites
+
+
+def _forget_prerequisites(self) -> None:
+    try:
+        _PREREQUISITES.pop(self.connection, None)
+    except TypeError:
+        pass
+
+
+def _replication_ok(self, prerequisites: Dict[str, Any]) -> bool:
+    if prerequisites["rolreplication"] is True:
+        self._messenger.success("Replication privilege confirmed.")
+        self._logger.info(f"User '{self._user}' has replication privileges.")
+        return True
+    alter_role = sql.SQL("ALTER ROLE {} WITH REPLICATION;").format(
+        sql.Identifier(self._user)
+    ).as_string(self.connection)
+    self._messenger.error(
+        f"User '{self._user}' does not have REPLICATION privilege."
+        f"\nINSTRUCTION: Run '{alter_role}' as a superuser."
+    )
+    self._logger.error(f"Replication privilege check failed for user '{self._user}'.")
+    return False
+
+
+def _wal_level_ok(self, prerequisites: Dict[str, Any]) -> bool:
+    level = prerequisites["wal_level"]
+    if level not in ('replica', 'logical', 'archive'):
+        self._messenger.error(
+            f"wal_level is set to '{level}'. It must be 'replica' or higher for replication."
+            "\nINSTRUCTION: Set wal_level to 'replica' or higher in postgresql.conf and restart the server."
+        )
+        self._logger.error(f"wal_level check failed: '{level}'.")
+        return False
+    self._messenger.success(f"wal_level is set to '{level}'.")
+    self._logger.info(f"wal_level check passed: '{level}'.")
+    return True
+
+
+def _archive_mode_ok(self, prerequisites: Dict[str, Any]) -> bool:
+    """archive_mode must be 'on' or 'always' for any PITR-capable backup strategy."""
+    mode = prerequisites["archive_mode"]
+    if mode not in ('on', 'always'):
+        self._messenger.error(
+        f"archive_mode is set to '{mode}'. It must be 'on' or 'always' for PITR."
+        "\n\nINSTRUCTION: To enable PITR, please configure **TWO** parameters in postgresql.conf:"
+        "\n1. wal_level = replica (if not already set)"
+        "\n2. archive_mode = on (or 'always' for PG13+)"
+        "\n3. archive_command = 'cp %p /path/to/wal_archive/%f' (Choose your secure path!)"
+        "\n\nAfter making changes, you MUST restart PostgreSQL."
+        "\nBackup cannot proceed without this setting."
+        )
+        self._logger.error(f"archive_mode check failed: '{mode}'. Backup aborted.")
+        return False
+    self._messenger.success(f"✓ Prerequisite check: archive_mode is '{mode}'.")
+    self._logger.info(f"archive_mode check passed: '{mode}'.")
+    return True
+
+
+def requires_postgres_prerequisites(*, replication: bool = False, wal_level: bool = False,
+                                    archive_mode: bool = False):
     """
-    Decorator to check if archive_mode is set to 'on' or 'always'.
-    This is a critical prerequisite for any PITR-capable backup strategy.
+    Check the selected backup prerequisites in one wrapper before calling the method.
+    All of them come from a single cached query; the first failing check aborts with False.
     """
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        query = "SHOW archive_mode;"
-        
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query)
-                result = cursor.fetchone()
-                
-                if result and result[0] in ('on', 'always'):
-                    self._messenger.success(f"✓ Prerequisite check: archive_mode is '{result[0]}'.")
-                    self._logger.info(f"archive_mode check passed: '{result[0]}'.")
-                    return func(self, *args, **kwargs)
-                else:
-                    self._messenger.error(
-                    f"archive_mode is set to '{result[0]}'. It must be 'on' or 'always' for PITR."
-                    "\n\nINSTRUCTION: To enable PITR, please configure **TWO** parameters in postgresql.conf:"
-                    "\n1. wal_level = replica (if not already set)"
-                    "\n2. archive_mode = on (or 'always' for PG13+)"
-                    "\n3. archive_command = 'cp %p /path/to/wal_archive/%f' (Choose your secure path!)"
-                    "\n\nAfter making changes, you MUST restart PostgreSQL."
-                    "\nBackup cannot proceed without this setting."
-
-                    )
-                    self._logger.error(f"archive_mode check failed: '{result[0]}'. Backup aborted.")
-                    return False 
-
-        except Exception as e:
-            self._messenger.error(f"Failed to check archive_mode: {e}")
-            self._logger.error(f"Failed to check archive_mode: {e}")
-            return False 
-        
-    return wrapper
\ No newline at end of file
+    checks = tuple(
+        check for enabled, check in (
+            (replication, _replication_ok),
+            (wal_level, _wal_level_ok),
+            (archive_mode, _archive_mode_ok),
+        ) if enabled
+    )
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                prerequisites = _load_prerequisites(self)
+                passed = all(check(self, prerequisites) for check in checks)
+            except Exception as e:
+                self._messenger.error(f"Failed to check backup prerequisites: {e}")
+                self._logger.error(f"Failed to check backup prerequisites: {e}")
+                return False
+
+            if not passed:
+                _forget_prerequisites(self)
+                return False
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Single-check aliases for callers outside PostgresClient.backup_full
+requires_replication_privilege = requires_postgres_prerequisites(replication=True)
+_check_wal_level = requires_postgres_prerequisites(wal_level=True)
+_check_archive_mode = requires_postgres_prerequisites(archive_mode=True)
@@ -1,22 +1,35 @@
 from functools import wraps
-from inspect import signature
-from typing import Any, Callable, TypeVar, cast
+from inspect import Parameter, signature
+from typing import Any, Callable, Optional, TypeVar, cast
 
 F = TypeVar('F', bound=Callable[..., Any])
 
+_POSITIONAL = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+
 def not_none(*not_none_args: str) -> Callable[[F], F]:
     """Decorator to ensure specified arguments are not None."""
     def decorator(func: F) -> F:
+        # Resolve each checked argument to (positional index, default) once, not per call
+        params = list(signature(func).parameters.values())
+        checks: list[tuple[str, Optional[int], Any]] = []
+        for arg_name in not_none_args:
+            index = next((i for i, p in enumerate(params) if p.name == arg_name), None)
+            param = params[index] if index is not None else None
+            default = None if param is None or param.default is Parameter.empty else param.default
+            if param is not None and param.kind not in _POSITIONAL:
+                index = None
+            checks.append((arg_name, index, default))
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            sig = signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            for arg_name in not_none_args:
-                if bound_args.arguments.get(arg_name) is None:
+            for arg_name, index, default in checks:
+                if index is not None and index < len(args):
+                    value = args[index]
+                else:
+                    value = kwargs.get(arg_name, default)
+                if value is None:
                     raise ValueError(f"Argument '{arg_name}' cannot be None")
             
             return func(*args, **kwargs)
         return cast(F, wrapper)
-    return decorator
\ No newline at end of file
+    return decorator
@@ -1,5 +1,20 @@
 from functools import wraps
 import shutil
+from typing import Dict, Optional
+
+# PATH lookups that succeeded; misses are retried so a tool installed mid-session is found.
+_FOUND_UTILITIES: Dict[str, str] = {}
+
+
+def find_utility(utility_name: str) -> Optional[str]:
+    """shutil.which() memoised per process for utilities that were found."""
+    path = _FOUND_UTILITIES.get(utility_name)
+    if path is None:
+        path = shutil.which(utility_name)
+        if path is not None:
+            _FOUND_UTILITIES[utility_name] = path
+    return path
+
 
 def check_utility_available(utility_name):
     """
@@ -9,10 +24,10 @@ def check_utility_available(utility_name):
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            if not shutil.which(utility_name):
+            if not find_utility(utility_name):
                 self._messenger.error(f"{utility_name} utility not found in PATH. Please install it.")
                 self._logger.error(f"{utility_name} utility not found")
                 return False
             return func(self, *args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
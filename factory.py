@@ -13,19 +13,28 @@ class DatabaseClient(ABC):
     def execute_query(self, query):
         pass
 
+    def preview_query(self, query, limit: int = 10):
+        """Return (rows, columns) with at most `limit` + 1 rows; the extra row means more exist."""
+        result = self.execute_query(query)
+        if result is None:
+            return None
+        rows, columns = result
+        return rows[:limit + 1], columns
+
     @abstractmethod
-    def extract_sql_query(self, query, outpath):
+    def extract_sql_query(self, query, outpath, server_side: bool = False, copy_mode: bool = False,
+                          compress: bool = False):
         pass
 
     @abstractmethod
     def backup_full(
-        self, outpath: str, single_archive: bool = True, storage: str = "local"
+        self, outpath: str, single_archive: bool = True, storage: str = "local", verify: bool = False
     ) -> bool:
         """Create full database backup with zstd compression"""
         pass
 
     @abstractmethod
-    def validate_connection(self):
+    def validate_connection(self, deep: bool = False):
         pass
 
     @property
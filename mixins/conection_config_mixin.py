@@ -1,6 +1,20 @@
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict
+
 from console_utils import get_messenger
 from custom_logging import BackupLogger
 
+_default_loggers: Dict[str, BackupLogger] = {}
+
+def _default_logger(database: str) -> BackupLogger:
+    """Shared per-database logger, so clients without one reuse its handlers and catalog."""
+    logger = _default_loggers.get(database)
+    if logger is None:
+        logger = _default_loggers[database] = BackupLogger(name=f"backup_{database}",
+                                                           log_file=f"backup_{database}.log")
+    return logger
+
 class ConnectionConfigMixin:
     def __init__(self, host, database, user, password, _compressing_level = 4, logger: BackupLogger = None, messenger=None, port=5432,
                      utility_version="1.0.0"):
@@ -12,8 +26,7 @@ class ConnectionConfigMixin:
         self._utility_version = utility_version
         self._database_version = None
         self.compress: bool = False
-        self._logger = logger if logger is not None else BackupLogger(name=f"backup_{database}",
-                                                                      log_file=f"backup_{database}.log")
+        self._logger = logger if logger is not None else _default_logger(database)
         self._messenger = messenger if messenger is not None else get_messenger()
         self._compressing_level = _compressing_level #TODO CLI REQUEST
         self._database_engine = getattr(self, "_database_engine", "unknown")
@@ -25,9 +38,9 @@ class ConnectionConfigMixin:
     @property
     def database_name(self):
         return self._database
-    @property
+    @cached_property
     def connection_params(self):
-        """Return connection parameters for backup utilities"""
+        """Return connection parameters for backup utilities, built on first access."""
         params = {
             'host': self._host,
             'port': self._port,
@@ -38,16 +51,27 @@ class ConnectionConfigMixin:
         }
         
         # Only include optional params if they exist
-        if hasattr(self, '_login_path') and self._login_path:
+        if self._login_path:
             params['login_path'] = self._login_path
         
-        if hasattr(self, '_socket') and self._socket:
+        if self._socket:
             params['socket'] = self._socket
             
-        if hasattr(self, '_use_pgpass') and self._use_pgpass:
+        if getattr(self, '_use_pgpass', False):
             params['use_pgpass'] = self._use_pgpass
         
-        return params
+        return MappingProxyType(params)
+
+    @cached_property
+    def _query_executor(self):
+        """Shared by every query call; the executor holds no per-query state."""
+        from services.execution.executor import QueryExecutor
+        return QueryExecutor(self, self._logger, self._messenger)
+
+    @cached_property
+    def _query_result_exporter(self):
+        from services.execution.exporter import QueryResultExporter
+        return QueryResultExporter(self._logger, self._messenger, self._database)
 
     def get_connection_params(self):
         return self.connection_params
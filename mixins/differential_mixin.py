@@ -1,9 +1,15 @@
+from functools import cached_property
+from importlib import import_module
+from types import MappingProxyType
 from typing import Any
 from custom_logging import BackupLogger
-from services.backup.core import DifferentialBackupService
 from services.backup.metadata import BackupMetadataReader
-from services.backup.differential.strategy.postgres_strategy import PostgresDifferentialBackupStrategy
-from services.backup.differential.strategy.mysql_strategy import MySQLDifferentialBackupStrategy
+
+# Engine -> (module, class); imported on first use so a client never loads the other engine's driver
+_STRATEGY_BY_ENGINE = MappingProxyType({
+    "mysql": ("services.backup.differential.strategy.mysql_strategy", "MySQLDifferentialBackupStrategy"),
+    "postgresql": ("services.backup.differential.strategy.postgres_strategy", "PostgresDifferentialBackupStrategy"),
+})
 
 
 class DifferentialBackupMixin:
@@ -19,21 +25,26 @@ class DifferentialBackupMixin:
     _database: str
     _port: int
 
-    def perform_differential_backup(self, metadata_reader: BackupMetadataReader):
-        """Performs differential backup using appropriate strategy for database type"""
+    @cached_property
+    def _differential_service(self):
+        """Strategy and service for this client's engine; both are stateless, so built once."""
+        from services.backup.core import DifferentialBackupService
+
         database_engine = getattr(self, "database_engine", None) or getattr(
             self, "_database_engine", None
         )
 
-        if database_engine == "mysql":
-            strategy = MySQLDifferentialBackupStrategy(self, self._logger, self._messenger)
-        elif database_engine == "postgresql":
-            strategy = PostgresDifferentialBackupStrategy(self, self._logger, self._messenger)
-        else:
+        try:
+            module_name, class_name = _STRATEGY_BY_ENGINE[database_engine]
+        except KeyError:
             raise ValueError(
                 f"Unsupported database engine for differential backup: {database_engine}"
-            )
+            ) from None
+        strategy_class = getattr(import_module(module_name), class_name)
+        strategy = strategy_class(self, self._logger, self._messenger)
         
-        diff_service = DifferentialBackupService(self, self._logger, self._messenger, strategy)
-        
-        return diff_service.perform_differential_backup(metadata_reader)
+        return DifferentialBackupService(self, self._logger, self._messenger, strategy)
+
+    def perform_differential_backup(self, metadata_reader: BackupMetadataReader):
+        """Performs differential backup using appropriate strategy for database type"""
+        return self._differential_service.perform_differential_backup(metadata_reader)
@@ -8,11 +8,12 @@ Zstd provides:
 - Ideal for database backups and fast restore operations
 """
 
-import subprocess
 import shutil
 from pathlib import Path
 from typing import Optional
-import sys
+
+from utility.dir_size import dir_size
+from utility.subprocess_pipeline import run_pipeline
 
 
 def check_zstd_available() -> bool:
@@ -20,7 +21,8 @@ def check_zstd_available() -> bool:
     return shutil.which("zstd") is not None and shutil.which("tar") is not None
 
 
-def create_single_archive(backup_dir: Path, logger, messenger) -> Optional[Path]:
+def create_single_archive(backup_dir: Path, logger, messenger,
+                          original_size: Optional[int] = None) -> Optional[Path]:
     """
     Create a single tar.zst archive from backup directory.
     
@@ -28,6 +30,7 @@ def create_single_archive(backup_dir: Path, logger, messenger) -> Optional[Path]
         backup_dir: Path to the backup directory to archive
         logger: Logger instance for logging
         messenger: Messenger instance for user messages
+        original_size: Size of backup_dir in bytes, if the caller already knows it
         
     Returns:
         Path to created archive, or None if failed
@@ -55,39 +58,24 @@ def create_single_archive(backup_dir: Path, logger, messenger) -> Optional[Path]
         zstd_compress = [
             "zstd",
             "-3",  
-            "-T4", 
+            "-T0",  # One worker per core
+            "--long=27",  # 128 MiB window: matches repeated pages across relation files
             "-o", str(archive_path)  # Output file
         ]
         
-        messenger.info("⏳ Archiving (level 3, 4 threads)...")
-        
-        tar_process = subprocess.Popen(
-            tar_create,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        zstd_process = subprocess.Popen(
-            zstd_compress,
-            stdin=tar_process.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        messenger.info("⏳ Archiving (level 3, all cores, long-distance matching)...")
         
-        tar_process.stdout.close()
+        result = run_pipeline(tar_create, zstd_compress)
         
-        zstd_stdout, zstd_stderr = zstd_process.communicate()
-        tar_process.wait()
-        
-        if tar_process.returncode != 0:
-            tar_stderr = tar_process.stderr.read().decode() if tar_process.stderr else ""
+        if result.producer_returncode != 0:
+            tar_stderr = result.producer_stderr.decode(errors="replace")
             error_msg = f"tar failed: {tar_stderr}"
             messenger.error(f"Archive creation failed: {error_msg}")
             logger.error(f"tar failed: {tar_stderr}")
             return None
         
-        if zstd_process.returncode != 0:
-            error_msg = zstd_stderr.decode() if zstd_stderr else "Unknown error"
+        if result.consumer_returncode != 0:
+            error_msg = result.consumer_stderr.decode(errors="replace") or "Unknown error"
             messenger.error(f"Compression failed: {error_msg}")
             logger.error(f"zstd failed: {error_msg}")
             return None
@@ -97,7 +85,8 @@ def create_single_archive(backup_dir: Path, logger, messenger) -> Optional[Path]
             logger.error(f"Archive not found: {archive_path}")
             return None
         
-        original_size = sum(f.stat().st_size for f in backup_dir.rglob('*') if f.is_file())
+        if original_size is None:
+            original_size = dir_size(backup_dir)
         archive_size = archive_path.stat().st_size
         compression_ratio = (1 - archive_size / original_size) * 100 if original_size > 0 else 0
         
@@ -120,6 +109,20 @@ def create_single_archive(backup_dir: Path, logger, messenger) -> Optional[Path]
         return None
 
 
+def archive_backup(backup_dir: Path, metadata: dict, logger, messenger,
+                   original_size: Optional[int] = None) -> None:
+    """Run create_single_archive for a finished backup and record the result in `metadata`."""
+    messenger.section_header("Creating Single Archive (zstd)")
+    archive_path = create_single_archive(backup_dir, logger, messenger, original_size=original_size)
+    if archive_path:
+        metadata["archive_path"] = str(archive_path)
+        metadata["archive_format"] = "tar+zstd"
+        metadata["archive_size_bytes"] = archive_path.stat().st_size
+        messenger.success(f"✓ Single archive ready: {archive_path.name}")
+    else:
+        messenger.warning("Single archive creation skipped/failed - backup remains as directory")
+
+
 def extract_archive(archive_path: Path, output_dir: Path, logger, messenger) -> bool:
     """
     Extract a tar.zst archive for restore operations.
@@ -154,7 +157,7 @@ def extract_archive(archive_path: Path, output_dir: Path, logger, messenger) ->
             "zstd",
             "-d", 
             "-c", 
-            "-T4",  
+            "--long=27",  
             str(archive_path)
         ]
         
@@ -166,33 +169,17 @@ def extract_archive(archive_path: Path, output_dir: Path, logger, messenger) ->
         
         messenger.info("⏳ Extracting...")
         
-        zstd_process = subprocess.Popen(
-            zstd_decompress,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        tar_process = subprocess.Popen(
-            tar_extract,
-            stdin=zstd_process.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
-        
-        zstd_process.stdout.close()
-        
-        tar_stdout, tar_stderr = tar_process.communicate()
-        zstd_process.wait()
+        result = run_pipeline(zstd_decompress, tar_extract)
         
-        if zstd_process.returncode != 0:
-            zstd_stderr = zstd_process.stderr.read().decode() if zstd_process.stderr else ""
+        if result.producer_returncode != 0:
+            zstd_stderr = result.producer_stderr.decode(errors="replace")
             error_msg = f"zstd decompression failed: {zstd_stderr}"
             messenger.error(f"Extraction failed: {error_msg}")
             logger.error(error_msg)
             return False
         
-        if tar_process.returncode != 0:
-            error_msg = tar_stderr.decode() if tar_stderr else "Unknown error"
+        if result.consumer_returncode != 0:
+            error_msg = result.consumer_stderr.decode(errors="replace") or "Unknown error"
             messenger.error(f"Extraction failed: {error_msg}")
             logger.error(f"tar extraction failed: {error_msg}")
             return False
@@ -1,9 +1,9 @@
-import json
 from pathlib import Path
 
 from services.backup.metadata import BackupMetadataReader
 from services.backup.differential.strategy_base import IDifferentialBackupStrategy
 from services.interfaces import IConnectionProvider, ILogger, IMessenger
+from utility.json_io import write_json
 
 
 class DifferentialBackupService:
@@ -33,11 +33,10 @@ class DifferentialBackupService:
         """Writes the backup metadata to a JSON file in the specified output path"""
         try:
             metadata_file = output_path / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            write_json(metadata_file, metadata)
             self._messenger.info(f"Metadata saved: {metadata_file}")
             return True
-        except Exception as e:
+        except OSError as e:
             self._messenger.error(f"Failed to write metadata file: {e}")
             self._logger.error(f"Failed to write metadata file: {e}")
             return False
@@ -1,10 +1,10 @@
 from services.backup.differential.strategy_base import DifferentialBackupStrategyBase
 from services.backup.metadata import BackupMetadataReader
 import os
-import subprocess
-from datetime import datetime
 from pathlib import Path
 
+from utility.subprocess_pipeline import run_streaming
+
 
 class MySQLDifferentialBackupStrategy(DifferentialBackupStrategyBase):
     def __init__(self, connection_provider, logger, messenger):
@@ -43,8 +43,8 @@ class MySQLDifferentialBackupStrategy(DifferentialBackupStrategyBase):
         
         backup_root_dir = full_backup_path.parent
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        diff_backup_dir = backup_root_dir / f"differential_{connection_params['database']}_{timestamp}_{metadata['id'].split('_')[-1]}"
+        # The id is already differential_<database>_<start timestamp>_<suffix>
+        diff_backup_dir = backup_root_dir / metadata["id"]
         diff_backup_dir.mkdir(parents=True, exist_ok=True)
         
         base_backup_ref = diff_backup_dir / "base_backup_id.txt"
@@ -88,16 +88,11 @@ class MySQLDifferentialBackupStrategy(DifferentialBackupStrategyBase):
             self._messenger.info(f"Running xtrabackup incremental backup...")
             self._logger.info(f"Command: {' '.join(xtrabackup_cmd)}")
             
-            result = subprocess.run(
-                xtrabackup_cmd,
-                capture_output=True,
-                text=True,
-                env=env
-            )
+            result = run_streaming(xtrabackup_cmd, env=env, on_line=self._logger.info)
             
             if result.returncode != 0:
-                self._messenger.error(f"xtrabackup failed: {result.stderr}")
-                self._logger.error(f"xtrabackup stderr: {result.stderr}")
+                self._messenger.error(f"xtrabackup failed: {result.stderr_tail}")
+                self._logger.error(f"xtrabackup stderr: {result.stderr_tail}")
                 self._logger.finish_backup(metadata, success=False)
                 return False
 
@@ -108,7 +103,7 @@ class MySQLDifferentialBackupStrategy(DifferentialBackupStrategyBase):
                 self._logger.finish_backup(metadata, success=False)
                 return False
             
-            total_size = sum(f.stat().st_size for f in diff_backup_dir.rglob('*') if f.is_file())
+            total_size = self._calculate_dir_size(diff_backup_dir)
             
             self._messenger.success(f"Differential backup created at {diff_backup_dir}")
             self._messenger.info(f"Backup size: {total_size / (1024**2):.2f} MB")
@@ -118,7 +113,7 @@ class MySQLDifferentialBackupStrategy(DifferentialBackupStrategyBase):
             metadata["parent_backup_location"] = str(full_backup_path)
             metadata["parent_backup_id"] = full_backup_path.name
             metadata["backup_checkpoints_path"] = str(checkpoints_file)
-            metadata["xtrabackup_output"] = result.stdout[-500:] if result.stdout else ""
+            metadata["xtrabackup_output"] = result.stderr_tail[-500:]
             
             return self.finalize_backup(
                 metadata,
@@ -1,12 +1,17 @@
 from services.backup.differential.strategy_base import DifferentialBackupStrategyBase
 from services.backup.metadata import BackupMetadataReader
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import tarfile
 import shutil
 from pathlib import Path
+from typing import List
 
 from services.walvalidation.wal_check import WalChainValidation
 
+# WAL segments are independent 16 MiB files; copying several at once keeps the
+# archive and backup disks busy (copy2 releases the GIL in sendfile/copy_file_range).
+WAL_COPY_WORKERS = 8
+
 
 class PostgresDifferentialBackupStrategy(DifferentialBackupStrategyBase):
     def __init__(self, connection_provider, logger, messenger):
@@ -57,8 +62,8 @@ class PostgresDifferentialBackupStrategy(DifferentialBackupStrategyBase):
         full_backup_path = Path(last_full_backup_location)
         backup_root_dir = full_backup_path.parent
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        diff_backup_dir = backup_root_dir / f"differential_{connection_params['database']}_{timestamp}_{metadata['id'].split('_')[-1]}"
+        # The id is already differential_<database>_<start timestamp>_<suffix>
+        diff_backup_dir = backup_root_dir / metadata["id"]
         diff_backup_dir.mkdir(parents=True, exist_ok=True)
 
         base_backup_ref = diff_backup_dir / "base_backup_id.txt"
@@ -214,17 +219,7 @@ class PostgresDifferentialBackupStrategy(DifferentialBackupStrategyBase):
             self._messenger.info(f"WAL range: {first_wal} → {last_wal}")
             self._messenger.info("Copying WAL files to backup...")
 
-            copied_count = 0
-            for wal_name in new_wal_files:
-                src = archive_directory / wal_name
-                dst = diff_backup_dir / wal_name
-                
-                try:
-                    shutil.copy2(src, dst)
-                    copied_count += 1
-                except Exception as e:
-                    self._messenger.error(f"Failed to copy {wal_name}: {e}")
-                    self._logger.error(f"Failed to copy WAL file {wal_name}: {e}")
+            copied_count = self._copy_wal_files(new_wal_files, archive_directory, diff_backup_dir)
 
             if copied_count == 0:
                 self._messenger.error("Failed to copy any WAL files!")
@@ -269,6 +264,22 @@ class PostgresDifferentialBackupStrategy(DifferentialBackupStrategyBase):
             self._logger.finish_backup(metadata, success=False)
             return False
 
+    def _copy_wal_files(self, wal_names: List[str], archive_directory: Path, diff_backup_dir: Path) -> int:
+        """Copy WAL segments with a small thread pool; returns the number copied."""
+
+        def copy_one(wal_name: str) -> bool:
+            try:
+                shutil.copy2(archive_directory / wal_name, diff_backup_dir / wal_name)
+                return True
+            except Exception as e:
+                self._messenger.error(f"Failed to copy {wal_name}: {e}")
+                self._logger.error(f"Failed to copy WAL file {wal_name}: {e}")
+                return False
+
+        workers = min(WAL_COPY_WORKERS, len(wal_names)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return sum(pool.map(copy_one, wal_names))
+
     def _build_common_metadata(
         self,
         diff_backup_dir: Path,
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-import json
 
 from services.backup.metadata import BackupMetadataReader
+from utility.dir_size import dir_size
+from utility.json_io import write_json
 
 
 class IDifferentialBackupStrategy(ABC):
@@ -28,11 +29,10 @@ class DifferentialBackupStrategyBase(IDifferentialBackupStrategy):
         """Writes backup metadata to a JSON file in the destination directory."""
         try:
             metadata_file = output_path / "metadata.json"
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            write_json(metadata_file, metadata)
             self._messenger.info(f"Metadata saved: {metadata_file}")
             return True
-        except Exception as e:  # pragma: no cover - logging side effect
+        except OSError as e:  # pragma: no cover - logging side effect
             self._messenger.error(f"Failed to write metadata file: {e}")
             self._logger.error(f"Failed to write metadata file: {e}")
             return False
@@ -40,7 +40,7 @@ class DifferentialBackupStrategyBase(IDifferentialBackupStrategy):
     @staticmethod
     def _calculate_dir_size(path: Path) -> int:
         """Calculate total size (in bytes) of files under a directory."""
-        return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+        return dir_size(path)
 
     def finalize_backup(
         self,
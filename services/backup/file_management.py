@@ -1,7 +1,8 @@
 
-import json
 from pathlib import Path
 
+from utility.json_io import write_json
+
 
 class BackupFileManager:
     def __init__(self, messenger, logger=None):
@@ -12,11 +13,10 @@ class BackupFileManager:
         """Writes the backup metadata to a JSON file in the specified output path"""
         try:
             metadata_file = output_path / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            write_json(metadata_file, metadata)
             self._messenger.info(f"Metadata saved: {metadata_file}")
             return True
-        except Exception as e:
+        except OSError as e:
             self._messenger.error(f"Failed to write metadata file: {e}")
             if self._logger is not None:
                 self._logger.error(f"Failed to write metadata file: {e}")
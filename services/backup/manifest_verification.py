@@ -0,0 +1,121 @@
+"""
+Verification of pg_basebackup tar-format backups against their backup_manifest.
+
+In tar format the manifest describes the files *inside* base.tar.gz and the
+per-tablespace <oid>.tar.gz archives, so each archive is streamed once and its
+members are hashed on the fly. Archives are verified in parallel: zlib and
+hashlib both release the GIL on large buffers.
+"""
+
+import hashlib
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from utility.json_io import loads_json
+
+_CHUNK_SIZE = 1024 * 1024
+_HASHLIB_ALGORITHMS = frozenset({"sha224", "sha256", "sha384", "sha512"})
+
+
+def _manifest_path(entry: Dict[str, Any]) -> str:
+    if "Path" in entry:
+        return entry["Path"]
+    return bytes.fromhex(entry["Encoded-Path"]).decode("utf-8", errors="surrogateescape")
+
+
+def _archive_prefix(archive: Path) -> str:
+    """Manifest path prefix for members of a pg_basebackup tar archive."""
+    oid = archive.name.split(".", 1)[0]
+    return "" if oid == "base" else f"pg_tblspc/{oid}/"
+
+
+def _verify_archive(archive: Path, expected: Dict[str, Dict[str, Any]]) -> Tuple[Set[str], List[str]]:
+    prefix = _archive_prefix(archive)
+    seen: Set[str] = set()
+    problems: List[str] = []
+
+    with tarfile.open(archive, "r|*") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            name = prefix + member.name.removeprefix("./")
+            entry = expected.get(name)
+            if entry is None:
+                continue
+            seen.add(name)
+
+            if member.size != entry.get("Size"):
+                problems.append(f"{name}: size {member.size} != manifest {entry.get('Size')}")
+                continue
+
+            algorithm = str(entry.get("Checksum-Algorithm", "NONE")).lower()
+            if algorithm not in _HASHLIB_ALGORITHMS:
+                continue
+
+            hasher = hashlib.new(algorithm)
+            stream = tar.extractfile(member)
+            while chunk := stream.read(_CHUNK_SIZE):
+                hasher.update(chunk)
+            if hasher.hexdigest() != entry.get("Checksum"):
+                problems.append(f"{name}: {algorithm} checksum mismatch")
+
+    return seen, problems
+
+
+def verify_backup_manifest(backup_dir: Path, logger, messenger) -> bool:
+    """
+    Check every file listed in backup_dir/backup_manifest against the tar archives.
+
+    Args:
+        backup_dir: Directory produced by `pg_basebackup -F t`
+        logger: Logger instance
+        messenger: Messenger instance
+
+    Returns:
+        True if all listed files are present with matching size and checksum
+    """
+    manifest_file = backup_dir / "backup_manifest"
+    try:
+        manifest = loads_json(manifest_file.read_bytes())
+    except (OSError, ValueError) as e:
+        messenger.error(f"Cannot read backup manifest: {e}")
+        logger.error(f"Manifest read failed for {manifest_file}: {e}")
+        return False
+
+    expected = {_manifest_path(entry): entry for entry in manifest.get("Files", [])}
+    archives = sorted(
+        p for p in backup_dir.glob("*.tar*")
+        if not p.name.startswith("pg_wal.")
+    )
+    if not archives:
+        messenger.error("No tar archives found to verify")
+        logger.error(f"Manifest verification: no archives in {backup_dir}")
+        return False
+
+    messenger.info(f"Verifying {len(expected)} files from {len(archives)} archive(s) against backup_manifest...")
+
+    seen: Set[str] = set()
+    problems: List[str] = []
+    try:
+        with ThreadPoolExecutor(max_workers=len(archives)) as pool:
+            for archive_seen, archive_problems in pool.map(lambda a: _verify_archive(a, expected), archives):
+                seen |= archive_seen
+                problems.extend(archive_problems)
+    except (OSError, tarfile.TarError) as e:
+        messenger.error(f"Manifest verification failed: {e}")
+        logger.error(f"Manifest verification error: {e}")
+        return False
+
+    problems.extend(f"{name}: missing from archives" for name in expected.keys() - seen)
+
+    if problems:
+        messenger.error(f"Manifest verification failed: {len(problems)} problem(s)")
+        for problem in problems[:20]:
+            logger.error(f"Manifest verification: {problem}")
+        return False
+
+    messenger.success(f"Manifest verified: {len(seen)} files match")
+    logger.info(f"Backup manifest verified: {manifest_file} ({len(seen)} files)")
+    return True
@@ -1,4 +1,4 @@
-from custom_logging import BackupCatalog
+from console_utils import print_sql_preview
 from services.backup.metadata import BackupMetadataReader
 
 class BackupService:
@@ -12,13 +12,16 @@ class BackupService:
         
         storage_type = getattr(parsed_args, 'storage_type', 'local')
         single_archive = getattr(parsed_args, 'single_archive', True)
-        self.dbclient.backup_full(outpath=parsed_args.path, single_archive=single_archive, storage=storage_type)
+        verify = getattr(parsed_args, 'verify', False)
+        self.dbclient.backup_full(
+            outpath=parsed_args.path, single_archive=single_archive, storage=storage_type, verify=verify
+        )
         
         
     def differential_backup(self, parsed_args) -> None:
         """Handle differential backup for the current database"""
         metadata_reader = BackupMetadataReader(
-            BackupCatalog(),
+            self.dbclient._logger.catalog,
             self.dbclient._messenger,
             self.dbclient._logger,
             self.dbclient._database
@@ -32,13 +35,18 @@ class BackupService:
             raise ValueError("No SQL query provided. Use: SQL <query>")
         
         if not parsed_args.extract:
-            result = self.dbclient.execute_query(sql_query)
+            result = self.dbclient.preview_query(sql_query)
             if result is None:
                 return
             rows, columns = result
             if columns:
-                self._print_sql_preview(rows)
+                print_sql_preview(rows, messenger=self.dbclient._messenger)
         else:
             if not parsed_args.path:
                 raise ValueError("Path required. Use: SQL <query> -extract -path <path>")
-            self.dbclient.extract_sql_query(sql_query, parsed_args.path)
+            server_side = getattr(parsed_args, 'server_side', False)
+            copy_mode = getattr(parsed_args, 'copy_mode', False)
+            compress = getattr(parsed_args, 'compress', False)
+            self.dbclient.extract_sql_query(
+                sql_query, parsed_args.path, server_side=server_side, copy_mode=copy_mode, compress=compress
+            )
@@ -1,4 +1,5 @@
 import sys
+import uuid
 
 import sqlparse
 
@@ -23,6 +24,12 @@ def analyze_sql(query: str) -> tuple[bool, str]:
         return False, f"SQL analysis failed: {e}"
 
 
+def is_select(query: str) -> bool:
+    """True for a single SELECT statement, i.e. one that can back a named cursor."""
+    parsed = sqlparse.parse(query)
+    return len(parsed) == 1 and parsed[0].get_type() == "SELECT"
+
+
 class QueryExecutor:
     def __init__(self,
                  connection_provider: IConnectionProvider,
@@ -32,20 +39,26 @@ class QueryExecutor:
         self._logger = logger
         self._messenger = messenger
 
-    def execute_query(self, query: str):
-        connection = None
+    def _confirm_query(self, query: str) -> bool:
+        """Ask before running a query flagged by analyze_sql; skip it when non-interactive."""
         is_safe, message = analyze_sql(query)
-        if not is_safe:
-            self._messenger.warning(message)
-            self._logger.warning(f"Dangerous query detected: {message}")
-            if sys.stdin.isatty():
-                confirmation = input("Continue? (Y/n): ")
-                if confirmation.upper() != "Y":
-                    self._logger.info("Query execution cancelled by user")
-                    return None
-            else:
-                self._logger.warning("Non-interactive mode: dangerous query skipped.")
-                return None
+        if is_safe:
+            return True
+        self._messenger.warning(message)
+        self._logger.warning(f"Dangerous query detected: {message}")
+        if sys.stdin.isatty():
+            confirmation = input("Continue? (Y/n): ")
+            if confirmation.upper() != "Y":
+                self._logger.info("Query execution cancelled by user")
+                return False
+            return True
+        self._logger.warning("Non-interactive mode: dangerous query skipped.")
+        return False
+
+    def execute_query(self, query: str, confirmed: bool = False):
+        connection = None
+        if not confirmed and not self._confirm_query(query):
+            return None
 
         try:
             connection = self._connection_provider.get_connection()
@@ -73,13 +86,71 @@ class QueryExecutor:
                     self._logger.warning("Rollback failed after query error")
             return None
 
-    def extract_sql_query(self, query: str, outpath, query_result_exporter):
+    def preview_query(self, query: str, limit: int, connection_factory):
+        """
+        Fetch at most `limit` + 1 rows of a SELECT through a named (server-side) cursor,
+        so previewing a large result never transfers more than that to the client.
+        `connection_factory` must yield a connection inside a transaction.
+        """
+        if not self._confirm_query(query):
+            return None
+
+        try:
+            with connection_factory() as connection:
+                with connection.cursor(name=f"preview_{uuid.uuid4().hex}") as cur:
+                    self._logger.info(f"Previewing query: {query[:100]}...")
+                    cur.execute(query)
+                    rows = cur.fetchmany(limit + 1)
+                    columns = [d[0] for d in cur.description]
+        except Exception as e:
+            self._messenger.error(f"Query failed: {e}")
+            self._logger.error(f"Query failed: {e}")
+            return None
+        self._logger.info(f"Query preview fetched {len(rows)} rows")
+        return (rows, columns)
+
+    def extract_sql_query(self, query: str, outpath, query_result_exporter,
+                          server_side: bool = False, copy_mode: bool = False, compress: bool = False,
+                          connection_factory=None):
+        """
+        Export `query` to CSV under `outpath`. With `connection_factory` (a transactional
+        connection context), SELECTs are streamed through a named cursor.
+        """
         self._logger.info(f"Starting query extraction to: {outpath}")
-        execute_result = self.execute_query(query)
+        if not self._confirm_query(query):
+            self._logger.warning("Query extraction cancelled or failed")
+            return False
+
+        if server_side:
+            connection = self._connection_provider.get_connection()
+            result = query_result_exporter.export_csv_server_side(connection, query, outpath)
+            if result is not None:
+                if result:
+                    self._logger.info(f"Query extraction completed: {result}")
+                return result
+
+        if copy_mode:
+            connection = self._connection_provider.get_connection()
+            result = query_result_exporter.export_csv_copy(connection, query, outpath, compress=compress)
+            if result:
+                self._logger.info(f"Query extraction completed: {result}")
+            else:
+                self._logger.error("Query extraction failed")
+            return result
+
+        if connection_factory is not None and is_select(query):
+            result = query_result_exporter.export_csv_streaming(connection_factory, query, outpath, compress=compress)
+            if result:
+                self._logger.info(f"Query extraction completed: {result}")
+            else:
+                self._logger.error("Query extraction failed")
+            return result
+
+        execute_result = self.execute_query(query, confirmed=True)
         if execute_result is None:
             self._logger.warning("Query extraction cancelled or failed")
             return False
-        result = query_result_exporter.export_csv(execute_result, outpath, query)
+        result = query_result_exporter.export_csv(execute_result, outpath, query, compress=compress)
         if result:
             self._logger.info(f"Query extraction completed: {result}")
         else:
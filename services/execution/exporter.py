@@ -1,9 +1,21 @@
 import csv
+import io
+import shlex
+import shutil
+import subprocess
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 
 from services.interfaces import ILogger, IMessenger
 from datetime import datetime
 
+# Read size for COPY TO STDOUT; psycopg2 defaults to 8 KiB, zstd consumes ~128 KiB blocks
+COPY_BUFFER_SIZE = 128 * 1024
+# Rows per FETCH for streaming exports, and the file buffer the CSV writer fills
+STREAM_BATCH_SIZE = 10_000
+CSV_BUFFER_SIZE = 1 << 20
+
 class QueryResultExporter:
     def __init__(self,
                  logger: ILogger,
@@ -13,29 +25,32 @@ class QueryResultExporter:
         self._messenger = messenger
         self._database_name = database_name
 
-    def export_csv(self, rows, outpath, query: str = None):
+    def _build_filename(self, query: str = None) -> str:
+        if query:
+            query_upper = query.upper().strip()
+            if "FROM" in query_upper:
+                table_part = query_upper.split("FROM")[1].split()[0]
+                table_name = table_part.strip('"').strip("'").replace(".", "_")
+                return f"query_{table_name}_{self._database_name}.csv"
+            return f"query_result_{self._database_name}.csv"
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"query_{timestamp}_{self._database_name}.csv"
+
+    def _output_file(self, outpath, query: str, suffix: str = "") -> Path:
+        """Create `outpath` (str or Path) and return the export file path inside it."""
+        outpath = Path(outpath)
+        outpath.mkdir(parents=True, exist_ok=True)
+        return outpath / f"{self._build_filename(query)}{suffix}"
+
+    def export_csv(self, rows, outpath, query: str = None, compress: bool = False):
+        compress = self._zstd_usable(compress)
         try:
             if not rows or (isinstance(rows, tuple) and not rows[0]):
                 self._messenger.warning("No data to export")
                 self._logger.warning("No data to export")
                 return False
 
-            outpath = Path(outpath) if isinstance(outpath, str) else outpath
-            outpath.mkdir(parents=True, exist_ok=True)
-
-            if query:
-                query_upper = query.upper().strip()
-                if "FROM" in query_upper:
-                    table_part = query_upper.split("FROM")[1].split()[0]
-                    table_name = table_part.strip('"').strip("'").replace(".", "_")
-                    filename = f"query_{table_name}_{self._database_name}.csv"
-                else:
-                    filename = f"query_result_{self._database_name}.csv"
-            else:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"query_{timestamp}_{self._database_name}.csv"
-
-            file_path = outpath / filename
+            file_path = self._output_file(outpath, query, ".zst" if compress else "")
             if isinstance(rows, tuple) and len(rows) == 2:
                 data, columns = rows
             else:
@@ -43,7 +58,7 @@ class QueryResultExporter:
                 self._logger.error("Invalid CSV export data format")
                 return False
 
-            with file_path.open("w", newline="", encoding="utf-8") as f:
+            with self._open_csv(file_path, compress) as f:
                 writer = csv.writer(f)
                 writer.writerow(columns)
                 writer.writerows(data)
@@ -56,3 +71,185 @@ class QueryResultExporter:
             self._messenger.error(f"Failed to save query result: {e}")
             self._logger.error(f"CSV export failed: {e}")
             return False
+
+    def export_csv_streaming(self, connection_factory, query: str, outpath, compress: bool = False):
+        """
+        Export a SELECT through a named (server-side) cursor, writing each batch of
+        STREAM_BATCH_SIZE rows as it arrives so the result is never held in memory.
+        `connection_factory` must yield a connection inside a transaction.
+        """
+        compress = self._zstd_usable(compress)
+        file_path = None
+        row_count = 0
+        try:
+            with connection_factory() as connection:
+                with connection.cursor(name=f"export_{uuid.uuid4().hex}") as cur:
+                    cur.execute(query)
+                    batch = cur.fetchmany(STREAM_BATCH_SIZE)
+                    if not batch:
+                        # Nothing to write: leave outpath untouched
+                        self._messenger.warning("No data to export")
+                        self._logger.warning("No data to export")
+                        return False
+
+                    file_path = self._output_file(outpath, query, ".zst" if compress else "")
+                    self._logger.info(f"Streaming export: {query[:100]}... -> {file_path}")
+                    with self._open_csv(file_path, compress) as f:
+                        writer = csv.writer(f)
+                        writer.writerow([d[0] for d in cur.description])
+                        while batch:
+                            writer.writerows(batch)
+                            row_count += len(batch)
+                            batch = cur.fetchmany(STREAM_BATCH_SIZE)
+        except Exception as e:
+            if file_path is not None:
+                file_path.unlink(missing_ok=True)
+            self._messenger.error(f"Failed to save query result: {e}")
+            self._logger.error(f"Streaming CSV export failed: {e}")
+            return False
+
+        file_size = file_path.stat().st_size
+        self._messenger.success(f"Saved: {file_path} ({row_count} rows, {file_size / 1024:.2f} KB)")
+        self._logger.info(f"Query result exported: {file_path} ({row_count} rows, {file_size} bytes)")
+        return str(file_path)
+
+    def _zstd_usable(self, compress: bool) -> bool:
+        if compress and shutil.which("zstd") is None:
+            self._messenger.warning("zstd not found - writing uncompressed CSV")
+            self._logger.warning("zstd not available for CSV export")
+            return False
+        return compress
+
+    @contextmanager
+    def _zstd_writer(self, file_path: Path):
+        """Binary stream into a local `zstd` process writing `file_path`."""
+        process = subprocess.Popen(
+            ["zstd", "-q", "-T0", "-f", "-o", str(file_path)],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=CSV_BUFFER_SIZE,
+        )
+        try:
+            yield process.stdin
+        finally:
+            process.stdin.close()
+            stderr = process.stderr.read()
+            process.wait()
+        if process.returncode != 0:
+            raise RuntimeError(f"zstd failed: {stderr.decode(errors='replace').strip()}")
+
+    @contextmanager
+    def _open_csv(self, file_path: Path, compress: bool):
+        """Text file for csv.writer; with `compress`, compressed inline by zstd."""
+        if not compress:
+            with file_path.open("w", newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE) as f:
+                yield f
+            return
+        with self._zstd_writer(file_path) as stream:
+            with io.TextIOWrapper(stream, encoding="utf-8", newline="") as f:
+                yield f
+
+    def _copy_to_zstd(self, cursor, copy_sql: str, file_path: Path) -> None:
+        """Feed COPY output straight into a local `zstd` process writing `file_path`."""
+        with self._zstd_writer(file_path) as stream:
+            cursor.copy_expert(copy_sql, stream, size=COPY_BUFFER_SIZE)
+
+    def export_csv_copy(self, connection, query: str, outpath, compress: bool = False):
+        """
+        Export with `COPY ... TO STDOUT` so rows arrive over the COPY protocol and are
+        written to disk as they stream in, instead of being collected by fetchall().
+        With `compress`, the stream is piped through zstd into a .csv.zst file.
+        """
+        from psycopg2 import sql
+
+        compress = self._zstd_usable(compress)
+
+        file_path = None
+        try:
+            file_path = self._output_file(outpath, query, ".zst" if compress else "")
+
+            copy_sql = sql.SQL("COPY ({}) TO STDOUT WITH (FORMAT csv, HEADER true)").format(
+                sql.SQL(query.strip().rstrip(";"))
+            ).as_string(connection)
+
+            self._logger.info(f"COPY export: {query[:100]}... -> {file_path}")
+            with connection.cursor() as cur:
+                if compress:
+                    self._copy_to_zstd(cur, copy_sql, file_path)
+                else:
+                    with file_path.open("wb") as f:
+                        cur.copy_expert(copy_sql, f, size=COPY_BUFFER_SIZE)
+                row_count = cur.rowcount
+            connection.commit()
+        except Exception as e:
+            try:
+                connection.rollback()
+            except Exception:
+                self._logger.warning("Rollback failed after COPY export error")
+            if file_path is not None:
+                file_path.unlink(missing_ok=True)
+            self._messenger.error(f"Failed to save query result: {e}")
+            self._logger.error(f"COPY CSV export failed: {e}")
+            return False
+
+        file_size = file_path.stat().st_size
+        self._messenger.success(f"Saved: {file_path} ({row_count} rows, {file_size / 1024:.2f} KB)")
+        self._logger.info(f"Query result exported via COPY: {file_path} ({row_count} rows, {file_size} bytes)")
+        return str(file_path)
+
+    def export_csv_server_side(self, connection, query: str, outpath):
+        """
+        Export with `COPY ... TO PROGRAM` so the server pipes rows straight into zstd.
+
+        Only usable when the PostgreSQL server shares the filesystem with this host.
+        Returns None when the server cannot run the export (missing privilege, or
+        zstd on the server cannot write to `outpath`), so the caller can fall back
+        to the client-side export.
+        """
+        from psycopg2 import errors, sql
+
+        try:
+            # The server resolves relative paths against its data directory
+            file_path = self._output_file(Path(outpath).resolve(), query, ".zst")
+
+            program = f"zstd -q -T0 -f -o {shlex.quote(str(file_path))}"
+            copy_query = sql.SQL("COPY ({}) TO PROGRAM {} WITH (FORMAT csv, HEADER true)").format(
+                sql.SQL(query.strip().rstrip(";")),
+                sql.Literal(program),
+            )
+
+            self._logger.info(f"Server-side export: {query[:100]}... -> {file_path}")
+            with connection.cursor() as cur:
+                cur.execute(copy_query)
+                row_count = cur.rowcount
+            connection.commit()
+        except errors.InsufficientPrivilege as e:
+            connection.rollback()
+            self._messenger.warning("COPY TO PROGRAM not permitted for this role - using client-side export")
+            self._logger.warning(f"Server-side export not permitted: {e}")
+            return None
+        except errors.ExternalRoutineException as e:
+            # zstd exited non-zero on the server, typically because the postgres
+            # OS user cannot write into a directory created by this client.
+            connection.rollback()
+            self._messenger.warning("Server could not write the export file - using client-side export")
+            self._logger.warning(f"Server-side export program failed: {e}")
+            return None
+        except Exception as e:
+            try:
+                connection.rollback()
+            except Exception:
+                self._logger.warning("Rollback failed after server-side export error")
+            self._messenger.error(f"Failed to save query result: {e}")
+            self._logger.error(f"Server-side CSV export failed: {e}")
+            return False
+
+        if not file_path.exists():
+            self._messenger.error(f"Server reported success but {file_path} is not visible on this host")
+            self._logger.error(f"Server-side export file missing after COPY: {file_path}")
+            return False
+
+        file_size = file_path.stat().st_size
+        self._messenger.success(f"Saved: {file_path} ({row_count} rows, {file_size / 1024:.2f} KB)")
+        self._logger.info(f"Query result exported server-side: {file_path} ({row_count} rows, {file_size} bytes)")
+        return str(file_path)
@@ -1,7 +1,8 @@
-import json
 from pathlib import Path
 from typing import Dict, Any
 
+from utility.json_io import write_json
+
 
 class IncrementalMetadataWriter:
     """
@@ -35,14 +36,13 @@ class IncrementalMetadataWriter:
 
         try:
             out = Path(ctx.backup_dir) / "metadata.json"
-            with out.open("w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+            write_json(out, metadata)
 
             self._logger.info(f"Incremental metadata saved: {out}")
             if self._messenger:
                 self._messenger.info(f"Metadata saved: {out.name}")
             return True
-        except Exception as e:
+        except OSError as e:
             self._logger.error(f"Failed to write incremental metadata: {e}", exc_info=True)
             if self._messenger:
                 self._messenger.error(f"Failed to write incremental metadata: {e}")
@@ -1,3 +1,4 @@
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
@@ -7,6 +8,7 @@ from services.wal.pipeline.stage_validate import WalFileStabilityValidator
 from services.wal.pipeline.stage_atomic_write import AtomicWriteStage
 from services.wal.pipeline.stage_integrity import IntegrityStage
 from services.wal.pipeline.stage_journal import JournalStage
+from utility.log_batch import LogBatch
 
 
 @dataclass
@@ -106,19 +108,33 @@ class WalArchiverPipeline:
         self._stats = PipelineStats(total_files=len(wal_files))
         self._metadata_items = []
 
-        for wal_name in wal_files:
-            try:
-                self._process_one(wal_name, archive_dir, backup_dir)
-                self._stats.processed_files += 1
-            except Exception as e:
-                self._stats.skipped_files += 1
-                msg = f"Pipeline fatal error for {wal_name}: {e}"
-                self._stats.errors.append(msg)
-                self._logger.error(msg, exc_info=True)
-                raise
+        with self._batched_output():
+            for wal_name in wal_files:
+                try:
+                    self._process_one(wal_name, archive_dir, backup_dir)
+                    self._stats.processed_files += 1
+                except Exception as e:
+                    self._stats.skipped_files += 1
+                    msg = f"Pipeline fatal error for {wal_name}: {e}"
+                    self._stats.errors.append(msg)
+                    self._logger.error(msg, exc_info=True)
+                    raise
 
         return self._metadata_items, self._stats
 
+    def _batched_output(self) -> ExitStack:
+        """
+        Route per-file stage messages from the logger and messenger through one
+        shared LogBatch, so they are written in groups and keep their order.
+        Sinks without batched() write through as before.
+        """
+        batch = LogBatch()
+        stack = ExitStack()
+        for sink in (self._logger, self._messenger):
+            if hasattr(sink, "batched"):
+                stack.enter_context(sink.batched(batch))
+        return stack
+
     def _process_one(self, wal_name: str, archive_dir: Path, backup_dir: Path) -> None:
         """
         Process a single WAL file through all pipeline stages.
@@ -0,0 +1,24 @@
+# utility/dir_size.py
+import os
+from pathlib import Path
+from typing import Union
+
+
+def dir_size(path: Union[str, Path]) -> int:
+    """
+    Total size in bytes of regular files under `path` (symlinks are not followed).
+
+    Walks with os.scandir: file type comes from the directory listing (d_type), so
+    each file costs a single lstat instead of the is_file() + stat() pair of
+    `Path.rglob`, and no Path objects are built along the way.
+    """
+    total = 0
+    stack = [os.fspath(path)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
@@ -0,0 +1,35 @@
+# utility/json_io.py
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is always available
+    orjson = None
+
+# datetimes go through `default=str` like the stdlib path, so output matches either way
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+)
+
+
+def dumps_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """Serialize `data` to UTF-8 JSON bytes; uses orjson when installed (indent 2 or none)."""
+    if orjson is not None and indent in (None, 2):
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=str, option=option)
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def write_json(path: Union[str, Path], data: Any, indent: Optional[int] = 2) -> None:
+    """Write `data` as JSON to `path` in a single write."""
+    with open(path, "wb") as f:
+        f.write(dumps_json(data, indent))
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str; uses orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
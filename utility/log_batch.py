@@ -0,0 +1,52 @@
+# utility/log_batch.py
+import logging
+import sys
+import time
+from typing import List, Optional, Tuple
+
+
+class LogBatch:
+    """
+    Ordered buffer of info-level output shared by several sinks (BackupLogger, ConsoleMessenger).
+
+    Queued entries are written together: one console write, and one log record per run
+    of consecutive entries that target the same logger. The buffer flushes once it holds
+    `max_entries` entries or its oldest entry is `max_delay` seconds old. Sinks must call
+    flush() before writing anything they do not queue, which keeps the original order.
+    """
+
+    def __init__(self, max_entries: int = 32, max_delay: float = 1.0):
+        self._max_entries = max_entries
+        self._max_delay = max_delay
+        self._entries: List[Tuple[Optional[logging.Logger], str, Optional[str]]] = []
+        self._first_at = 0.0
+
+    def add(self, logger: Optional[logging.Logger], message: str, console_line: Optional[str] = None) -> None:
+        """Queue `message` for `logger` and, optionally, a line for stdout."""
+        if not self._entries:
+            self._first_at = time.monotonic()
+        self._entries.append((logger, message, console_line))
+        if len(self._entries) >= self._max_entries or time.monotonic() - self._first_at >= self._max_delay:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._entries:
+            return
+        entries, self._entries = self._entries, []
+
+        console_lines = [line for _, _, line in entries if line is not None]
+        if console_lines:
+            sys.stdout.write("\n".join(console_lines) + "\n")
+            sys.stdout.flush()
+
+        run_logger: Optional[logging.Logger] = None
+        run: List[str] = []
+        for logger, message, _ in entries:
+            if logger is not run_logger and run:
+                run_logger.info("\n".join(run))
+                run = []
+            run_logger = logger
+            if logger is not None:
+                run.append(message)
+        if run:
+            run_logger.info("\n".join(run))
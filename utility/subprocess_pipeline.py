@@ -0,0 +1,178 @@
+# utility/subprocess_pipeline.py
+import asyncio
+import os
+import subprocess
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence
+
+# fork()+exec() copies the parent's page tables, which gets slow once the client holds
+# large result sets. On Linux, CPython spawns with vfork() instead as long as no
+# preexec_fn, user/group switch, umask or session change is requested (posix_spawn is
+# only taken with close_fds=False, which we do not want). Keep every launch here free
+# of those options.
+_FAST_SPAWN = sys.platform != "linux" or getattr(subprocess, "_USE_VFORK", False)
+
+
+def _assert_fast_spawn() -> None:
+    assert _FAST_SPAWN, "subprocess is not using vfork(); launching tools will copy the client's memory map"
+
+
+PIPE_BUFFER_SIZE = 1 << 20
+
+
+def _enlarge_pipe(fd: int) -> None:
+    """Grow a pipe to PIPE_BUFFER_SIZE so producers do not stall every 64 KiB (Linux only, best effort)."""
+    try:
+        import fcntl
+        fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+    except (ImportError, AttributeError, OSError):
+        pass
+
+
+@dataclass
+class ProcessPipelineResult:
+    """
+    Outcome of a two-process `producer | consumer` pipeline.
+
+    Attributes:
+        producer_returncode (int): Exit code of the producing process (e.g. tar).
+        producer_stderr (bytes): Captured stderr of the producing process.
+        consumer_returncode (int): Exit code of the consuming process (e.g. zstd).
+        consumer_stderr (bytes): Captured stderr of the consuming process.
+    """
+    producer_returncode: int
+    producer_stderr: bytes
+    consumer_returncode: int
+    consumer_stderr: bytes
+
+
+async def run_pipeline_async(
+    producer_cmd: Sequence[str],
+    consumer_cmd: Sequence[str],
+    env: Optional[Dict[str, str]] = None,
+) -> ProcessPipelineResult:
+    """
+    Run `producer_cmd | consumer_cmd` and supervise both processes from the event loop.
+
+    The two processes are connected with an OS pipe, so the data never passes
+    through Python. Both stderr streams are drained concurrently while the
+    processes run, which avoids blocking on a full stderr pipe.
+    """
+    _assert_fast_spawn()
+    read_fd, write_fd = os.pipe()
+    _enlarge_pipe(write_fd)
+    producer = None
+    try:
+        try:
+            producer = await asyncio.create_subprocess_exec(
+                *producer_cmd,
+                stdout=write_fd,
+                stderr=asyncio.subprocess.PIPE,
+                env=env,
+            )
+        finally:
+            os.close(write_fd)
+
+        consumer = await asyncio.create_subprocess_exec(
+            *consumer_cmd,
+            stdin=read_fd,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+        )
+    except BaseException:
+        if producer is not None and producer.returncode is None:
+            producer.kill()
+            await producer.wait()
+        raise
+    finally:
+        os.close(read_fd)
+
+    (_, producer_stderr), (_, consumer_stderr) = await asyncio.gather(
+        producer.communicate(), consumer.communicate()
+    )
+
+    return ProcessPipelineResult(
+        producer_returncode=producer.returncode,
+        producer_stderr=producer_stderr or b"",
+        consumer_returncode=consumer.returncode,
+        consumer_stderr=consumer_stderr or b"",
+    )
+
+
+def _run_sync(coro):
+    """
+    Drive a coroutine to completion from synchronous code.
+
+    The interactive console dispatches commands on a worker thread, so this normally
+    runs the coroutine directly; if called from a thread with an active loop, the
+    coroutine gets its own loop on a helper thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def run_pipeline(
+    producer_cmd: Sequence[str],
+    consumer_cmd: Sequence[str],
+    env: Optional[Dict[str, str]] = None,
+) -> ProcessPipelineResult:
+    """Synchronous wrapper around run_pipeline_async."""
+    return _run_sync(run_pipeline_async(producer_cmd, consumer_cmd, env))
+
+
+@dataclass
+class StreamedProcessResult:
+    """
+    Outcome of run_streaming.
+
+    Attributes:
+        returncode (int): Exit code of the process.
+        stderr_tail (str): Last lines of stderr, for error reporting.
+    """
+    returncode: int
+    stderr_tail: str
+
+
+def run_streaming(
+    cmd: Sequence[str],
+    env: Optional[Dict[str, str]] = None,
+    on_line: Optional[Callable[[str], None]] = None,
+    tail_lines: int = 200,
+) -> StreamedProcessResult:
+    """
+    Run a long-lived tool (pg_basebackup, xtrabackup) without buffering its output.
+
+    stdout is discarded; stderr is read line by line as it is produced (`\r` progress
+    updates count as lines), forwarded to `on_line`, and only the last `tail_lines`
+    lines are kept.
+    """
+    _assert_fast_spawn()
+    tail: deque = deque(maxlen=tail_lines)
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    ) as process:
+        for line in process.stderr:
+            line = line.rstrip()
+            if not line:
+                continue
+            tail.append(line)
+            if on_line is not None:
+                on_line(line)
+        returncode = process.wait()
+
+    return StreamedProcessResult(returncode=returncode, stderr_tail="\n".join(tail))